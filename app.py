@@ -1,19 +1,24 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
 from typing import List, Optional, Tuple
 import streamlit as st
-import pandas as pd
+import numpy as np
+import bisect
+import heapq
 import json
 import re
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+
+# Cantidad de vacantes mostradas tras un análisis
+TOP_K_RESULTADOS = 10
 
 # ===============================
 # 📌 MODELOS DE DATOS
 # ===============================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExperienciaLaboral:
     """Representa una experiencia laboral en el perfil de un candidato."""
     puesto: str
@@ -30,15 +35,20 @@ class ExperienciaLaboral:
             f"  Descripción: {self.descripcion}"
         )
 
-@dataclass
+@dataclass(slots=True)
 class OfertaDeTrabajo:
     """Modela una oferta de trabajo con sus requisitos."""
     puesto: str
     empresa: str
     habilidades_requeridas: List[str] = field(default_factory=list)
     experiencia_minima_meses: int = 0
+    _habilidades_set: frozenset = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Normalizar una sola vez: la oferta se compara contra muchos perfiles
+        self._habilidades_set = frozenset(h.lower() for h in self.habilidades_requeridas)
 
-@dataclass
+@dataclass(slots=True)
 class PerfilCandidato:
     """Modela el perfil de un candidato en la plataforma."""
     nombre: str
@@ -47,15 +57,33 @@ class PerfilCandidato:
     resumen_profesional: str = ""
     habilidades: List[str] = field(default_factory=list)
     experiencias: List[ExperienciaLaboral] = field(default_factory=list)
+    # Fechas de experiencia como arreglos datetime64[M]; NaT marca una
+    # experiencia en curso ("Actualidad")
+    _exp_inicios: np.ndarray = field(init=False, repr=False)
+    _exp_fines: np.ndarray = field(init=False, repr=False)
+    _habilidades_set: set = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._habilidades_set = {h.lower() for h in self.habilidades}
+        # Orden descendente por fecha de inicio: el invariante sobre el que
+        # agregar_experiencia inserta con bisect
+        self.experiencias.sort(key=lambda exp: -exp.fecha_inicio.toordinal())
+        self._exp_inicios = np.array(
+            [e.fecha_inicio for e in self.experiencias], dtype='datetime64[M]')
+        self._exp_fines = np.array(
+            [e.fecha_fin if e.fecha_fin else 'NaT' for e in self.experiencias],
+            dtype='datetime64[M]')
 
     def get_experiencia_total_meses(self) -> int:
-        """Calcula los meses totales de experiencia del candidato."""
-        hoy = date.today()
-        total_meses = 0
-        for exp in self.experiencias:
-            fecha_fin = exp.fecha_fin or hoy
-            total_meses += (fecha_fin.year - exp.fecha_inicio.year) * 12 + (fecha_fin.month - exp.fecha_inicio.month)
-        return total_meses
+        """Calcula los meses totales de experiencia del candidato.
+
+        Resta los arreglos datetime64[M] en una sola operación vectorizada
+        en lugar de iterar experiencia por experiencia.
+        """
+        fines = np.where(np.isnat(self._exp_fines),
+                         np.datetime64(date.today(), 'M'),
+                         self._exp_fines)
+        return int((fines - self._exp_inicios).astype(int).sum())
 
     def get_habilidades_normalizadas(self) -> List[str]:
         """Devuelve las habilidades en minúsculas para comparación."""
@@ -63,24 +91,96 @@ class PerfilCandidato:
 
     def agregar_habilidad(self, habilidad: str) -> None:
         """Agrega una habilidad si no existe."""
-        if habilidad.lower() not in [h.lower() for h in self.habilidades]:
+        low = habilidad.lower()
+        if low not in self._habilidades_set:
+            self._habilidades_set.add(low)
             self.habilidades.append(habilidad)
 
+    def agregar_experiencia(self, experiencia: ExperienciaLaboral) -> None:
+        """Agrega una experiencia laboral al perfil, ordenada por fecha.
+
+        La lista se mantiene ordenada descendente por fecha de inicio;
+        insertar con bisect evita re-ordenar todo en cada alta.
+        """
+        bisect.insort(self.experiencias, experiencia,
+                      key=lambda exp: -exp.fecha_inicio.toordinal())
+        self._exp_inicios = np.append(
+            self._exp_inicios, np.datetime64(experiencia.fecha_inicio, 'M'))
+        fin = experiencia.fecha_fin
+        self._exp_fines = np.append(
+            self._exp_fines,
+            np.datetime64(fin, 'M') if fin else np.datetime64('NaT', 'M'))
+
+def verificar_compatibilidad(perfil: PerfilCandidato, oferta: OfertaDeTrabajo) -> Tuple[float, set, set]:
+    """Compara las habilidades del candidato contra las requeridas por la oferta.
+
+    Opera sobre los conjuntos normalizados que ambos objetos mantienen desde
+    su construcción: dos operaciones de set por llamada, sin reconstrucciones.
+    """
+    requeridas = oferta._habilidades_set
+    coincidentes = perfil._habilidades_set & requeridas
+    faltantes = requeridas - perfil._habilidades_set
+    porcentaje = len(coincidentes) / len(requeridas) if requeridas else 1.0
+    return porcentaje, coincidentes, faltantes
+
+def verificar_compatibilidad_batch(perfiles: List[PerfilCandidato],
+                                   ofertas: List[OfertaDeTrabajo]) -> np.ndarray:
+    """Calcula el porcentaje de compatibilidad de cada perfil contra cada oferta.
+
+    Codifica las habilidades como matrices de incidencia sobre un vocabulario
+    común y resuelve todos los pares con un único producto de matrices, en
+    lugar de C·O llamadas a verificar_compatibilidad.
+    """
+    skill_id = {}
+    for oferta in ofertas:
+        for habilidad in oferta._habilidades_set:
+            skill_id.setdefault(habilidad, len(skill_id))
+    if not skill_id:
+        return np.ones((len(perfiles), len(ofertas)))
+
+    c_mat = np.zeros((len(perfiles), len(skill_id)), dtype=np.int32)
+    for i, perfil in enumerate(perfiles):
+        for habilidad in perfil._habilidades_set:
+            j = skill_id.get(habilidad)
+            if j is not None:
+                c_mat[i, j] = 1
+    o_mat = np.zeros((len(ofertas), len(skill_id)), dtype=np.int32)
+    for i, oferta in enumerate(ofertas):
+        for habilidad in oferta._habilidades_set:
+            o_mat[i, skill_id[habilidad]] = 1
+
+    req_counts = o_mat.sum(axis=1)
+    porcentajes = (c_mat @ o_mat.T) / np.maximum(req_counts, 1)[None, :]
+    # Una oferta sin requisitos es compatible con cualquier perfil
+    porcentajes[:, req_counts == 0] = 1.0
+    return porcentajes
+
 # ===============================
 # 📊 FUNCIONES DE ANÁLISIS Y NLP
 # ===============================
 
+# Plegado de acentos con una tabla precompilada: str.translate corre en C,
+# así la comparación de sinónimos trabaja siempre sobre la forma sin tildes
+_ACCENT_TBL = str.maketrans('áéíóúÁÉÍÓÚüÜ', 'aeiouAEIOUuU')
+
+@lru_cache(maxsize=4096)
 def normalizar_habilidad(habilidad):
-    """Limpia la habilidad y maneja sinónimos básicos y versiones."""
-    habilidad = habilidad.lower().strip()
-    
-    # Normalizar sinónimos clave y términos compuestos
+    """Limpia la habilidad y maneja sinónimos básicos y versiones.
+
+    Las mismas cadenas se normalizan miles de veces por análisis; con el
+    cache cada valor repetido se resuelve con una búsqueda de dict.
+    """
+    habilidad = habilidad.lower().translate(_ACCENT_TBL).strip()
+
+    # Normalizar sinónimos clave y términos compuestos. Las formas
+    # canónicas también van sin tildes: todo lo que se compara (patrones
+    # del escáner, requisitos, CV plegado) vive en el mismo alfabeto
     if 'estadistica' in habilidad:
-        return 'estadística'
+        return 'estadistica'
     if 'trabajo en equipo' in habilidad or 'equipo' in habilidad:
         return 'trabajo en equipo'
-    if 'resolución' in habilidad and 'problemas' in habilidad:
-        return 'resolución de problemas'
+    if 'resolucion' in habilidad and 'problemas' in habilidad:
+        return 'resolucion de problemas'
     
     # Manejar versiones o términos compuestos 
     terminos_clave = ['python', 'sql', 'excel', 'javascript', 'node.js', 'google ads', 'seo', 'docker', 'liderazgo']
@@ -90,29 +190,50 @@ def normalizar_habilidad(habilidad):
             
     return habilidad
 
+@st.cache_resource(show_spinner=False)
+def _compilar_escaner_habilidades(lista_habilidades):
+    """Compila las habilidades conocidas en una sola alternancia regex.
+
+    Las más largas van primero para que ganen sobre sus prefijos; el motor
+    de re escanea el CV en una pasada en C en lugar de un `in` por habilidad.
+    """
+    normalizadas = {normalizar_habilidad(h) for h in lista_habilidades}
+    if not normalizadas:
+        return None
+    patron = '|'.join(re.escape(h) for h in sorted(normalizadas, key=len, reverse=True))
+    return re.compile(patron)
+
 def extraer_habilidades(cv_texto, lista_habilidades_conocidas):
     """Procesa el texto del CV y busca coincidencias con las habilidades conocidas."""
-    habilidades_encontradas = set()
-    habilidades_normalizadas = [normalizar_habilidad(h) for h in lista_habilidades_conocidas]
-    cv_texto_limpio = normalizar_habilidad(cv_texto)
-    
-    for habilidad in habilidades_normalizadas:
-        if habilidad in cv_texto_limpio:
-            habilidades_encontradas.add(habilidad)
-            
-    return habilidades_encontradas
+    escaner = _compilar_escaner_habilidades(lista_habilidades_conocidas)
+    if escaner is None:
+        return set()
+    # Minúsculas + plegado de tildes, sin normalizar_habilidad: esa función
+    # es para habilidades sueltas y colapsaba el CV completo a un solo
+    # término canónico (además de envenenar su lru_cache con textos enteros)
+    cv_texto_limpio = cv_texto.lower().translate(_ACCENT_TBL)
+    return set(escaner.findall(cv_texto_limpio))
+
+@st.cache_resource(show_spinner=False)
+def _build_vacancy_tfidf(vacantes):
+    """Ajusta el vectorizador TF-IDF una sola vez sobre las descripciones.
+
+    El fit es el costo dominante del análisis y no depende del CV, así que
+    se hace una vez por carga de vacantes; por clic solo se transforma el CV.
+    """
+    vectorizer = TfidfVectorizer(stop_words='english', lowercase=True)
+    tfidf_matrix = vectorizer.fit_transform([v['descripcion'] for v in vacantes])
+    return vectorizer, tfidf_matrix
 
 def calcular_similitud_tfidf(cv_texto, vacantes):
     """Calcula la similitud coseno entre el texto del CV y la descripción de cada vacante."""
-    documentos = [cv_texto] + [v['descripcion'] for v in vacantes]
-    
-    # Vectoriza los documentos (TF-IDF)
-    vectorizer = TfidfVectorizer(stop_words='english', lowercase=True)
-    tfidf_matrix = vectorizer.fit_transform(documentos)
-    
-    # Calcula la similitud coseno 
-    cosine_sim = cosine_similarity(tfidf_matrix[0], tfidf_matrix[1:])
-    scores = cosine_sim[0]
+    vectorizer, tfidf_matrix = _build_vacancy_tfidf(vacantes)
+
+    # Vectoriza solo el CV; las filas ya están normalizadas (norm='l2'),
+    # así que un único producto disperso devuelve la similitud coseno
+    # contra todas las vacantes a la vez
+    cv_vec = vectorizer.transform([cv_texto])
+    scores = (tfidf_matrix @ cv_vec.T).toarray().ravel()
     
     # Crea un diccionario {id_vacante: score_tfidf}
     tfidf_scores = {}
@@ -122,46 +243,105 @@ def calcular_similitud_tfidf(cv_texto, vacantes):
         
     return tfidf_scores
 
+@st.cache_data(show_spinner=False)
+def _requisitos_normalizados(vacantes):
+    """Normaliza los requisitos de cada vacante una sola vez por carga.
+
+    Devuelve {id_vacante: frozenset de requisitos normalizados}; el bucle de
+    matching solo hace intersecciones sobre estos conjuntos cacheados.
+    """
+    return {
+        v['id']: frozenset(map(normalizar_habilidad, v['requisitos_tecnicos']))
+                 | frozenset(map(normalizar_habilidad, v['requisitos_blandos']))
+        for v in vacantes
+    }
+
+@st.cache_data(show_spinner=False)
+def _cursos_por_habilidad(cursos):
+    """Indexa los cursos por habilidad normalizada para buscarlos en O(1)."""
+    indice = {}
+    for curso in cursos:
+        indice.setdefault(normalizar_habilidad(curso['habilidad']), []).append(curso)
+    return indice
+
+@st.cache_data(show_spinner=False)
+def _mascaras_requisitos(vacantes):
+    """Empaqueta los requisitos normalizados como máscaras de bits uint64.
+
+    Cada habilidad del vocabulario global recibe un bit; contar cumplidos se
+    vuelve un AND más popcount vectorizado (np.bitwise_count, NumPy 2.0+) en
+    lugar de intersecciones de sets vacante por vacante.
+    """
+    requisitos = _requisitos_normalizados(vacantes)
+    skill_id = {}
+    for req in requisitos.values():
+        for habilidad in sorted(req):
+            skill_id.setdefault(habilidad, len(skill_id))
+    palabras = max(1, (len(skill_id) + 63) // 64)
+    masks = np.zeros((len(vacantes), palabras), dtype=np.uint64)
+    for i, v in enumerate(vacantes):
+        for habilidad in requisitos[v['id']]:
+            j = skill_id[habilidad]
+            masks[i, j >> 6] |= np.uint64(1 << (j & 63))
+    return skill_id, masks
+
+@st.cache_data
+def _todas_habilidades(vacantes):
+    """Une los requisitos de todas las vacantes (se recalcula solo si cambian)."""
+    todas = set()
+    for v in vacantes:
+        todas.update(v['requisitos_tecnicos'])
+        todas.update(v['requisitos_blandos'])
+    return frozenset(todas)
+
 def aplicar_vacante_streamlit(cv_texto, VACANTES, CURSOS):
     """Versión Streamlit del endpoint /aplicar - procesa CV y devuelve recomendaciones."""
     if not cv_texto:
         return []
-    
+
     resultados = []
-    
-    # MODELO 1: Extracción de Habilidades (Base para Brechas)
-    todas_habilidades = set()
-    for v in VACANTES:
-        todas_habilidades.update(v['requisitos_tecnicos'])
-        todas_habilidades.update(v['requisitos_blandos'])
 
-    habilidades_cv = extraer_habilidades(cv_texto, todas_habilidades)
+    # MODELO 1: Extracción de Habilidades (Base para Brechas)
+    habilidades_cv = extraer_habilidades(cv_texto, _todas_habilidades(VACANTES))
     
     # MODELO 2: Similitud Coseno con TF-IDF (Score de Relevancia Semántica)
     tfidf_scores = calcular_similitud_tfidf(cv_texto, VACANTES)
+    requisitos = _requisitos_normalizados(VACANTES)
+    cursos_por_habilidad = _cursos_por_habilidad(CURSOS)
 
-    for vacante in VACANTES:
-        req_tec = set(normalizar_habilidad(h) for h in vacante['requisitos_tecnicos'])
-        req_blando = set(normalizar_habilidad(h) for h in vacante['requisitos_blandos'])
-        req_totales = req_tec.union(req_blando)
-        
+    # El conteo de requisitos cumplidos se hace para todas las vacantes de
+    # una vez: AND entre máscaras y popcount vectorizado
+    skill_id, req_masks = _mascaras_requisitos(VACANTES)
+    cv_mask = np.zeros(req_masks.shape[1], dtype=np.uint64)
+    for habilidad in habilidades_cv:
+        j = skill_id.get(habilidad)
+        if j is not None:
+            cv_mask[j >> 6] |= np.uint64(1 << (j & 63))
+    cumplidas_counts = np.bitwise_count(req_masks & cv_mask).sum(axis=1)
+    req_counts = np.bitwise_count(req_masks).sum(axis=1)
+    scores_cumplimiento = cumplidas_counts / np.maximum(req_counts, 1)
+
+    for i, vacante in enumerate(VACANTES):
+        req_totales = requisitos[vacante['id']]
+
+        # Los sets solo se usan para decodificar los nombres que se muestran;
+        # el score ya viene del popcount vectorizado
         habilidades_cumplidas = habilidades_cv.intersection(req_totales)
         habilidades_faltantes = req_totales - habilidades_cv
 
         # Cálculo del Score FINAL (Combinación de los dos modelos)
-        total_req = len(req_totales)
-        score_cumplimiento = len(habilidades_cumplidas) / total_req if total_req else 0
-        
+        score_cumplimiento = float(scores_cumplimiento[i])
+
         # Score de Relevancia Semántica (TF-IDF - Peso 40%)
         score_relevancia = tfidf_scores.get(vacante['id'], 0)
         
         # Fusión de scores para robustez
         puntaje_final = (score_cumplimiento * 0.6) + (score_relevancia * 0.4)
         
-        # Recomendación de Cursos
+        # Recomendación de Cursos: búsqueda directa por habilidad faltante
         cursos_recomendados = [
-            curso for curso in CURSOS 
-            if normalizar_habilidad(curso['habilidad']) in habilidades_faltantes
+            curso for habilidad in habilidades_faltantes
+            for curso in cursos_por_habilidad.get(habilidad, ())
         ]
 
         resultados.append({
@@ -172,53 +352,15 @@ def aplicar_vacante_streamlit(cv_texto, VACANTES, CURSOS):
             "cursos_recomendados": cursos_recomendados
         })
 
-    # Ordenar resultados por mejor match
-    resultados_ordenados = sorted(resultados, key=lambda x: x['puntaje_match'], reverse=True)
-    
-    return resultados_ordenados
+    # La interfaz solo muestra los mejores matches: top-K con un heap
+    # parcial en O(V log K) en lugar de ordenar todas las vacantes
+    return heapq.nlargest(TOP_K_RESULTADOS, resultados, key=lambda x: x['puntaje_match'])
 
 # ===============================
 # 🚀 APLICACIÓN STREAMLIT
 # ===============================
 
-def main():
-    # Configuración de la página
-    st.set_page_config(page_title="CogniLink UNRC", layout="wide")
-    
-    # Cargar datos (mock data o desde archivos)
-    try:
-        with open('vacantes.json', 'r', encoding='utf-8') as f:
-            VACANTES = json.load(f)
-        with open('cursos.json', 'r', encoding='utf-8') as f:
-            CURSOS = json.load(f)
-    except FileNotFoundError:
-        # Datos de ejemplo si no hay archivos
-        VACANTES = [
-            {
-                "id": 1,
-                "titulo": "Data Scientist",
-                "empresa": "Tech Solutions",
-                "descripcion": "Buscamos científico de datos con experiencia en Python y machine learning",
-                "requisitos_tecnicos": ["Python", "SQL", "Machine Learning", "Estadística"],
-                "requisitos_blandos": ["Trabajo en equipo", "Comunicación"]
-            },
-            {
-                "id": 2,
-                "titulo": "Desarrollador Full Stack",
-                "empresa": "Digital Labs",
-                "descripcion": "Desarrollador con conocimientos en JavaScript, Node.js y React",
-                "requisitos_tecnicos": ["JavaScript", "Node.js", "React", "SQL"],
-                "requisitos_blandos": ["Creatividad", "Resolución de problemas"]
-            }
-        ]
-        CURSOS = [
-            {"habilidad": "Python", "titulo_curso": "Curso intensivo de Python", "proveedor": "Coursera"},
-            {"habilidad": "SQL", "titulo_curso": "Bases de Datos SQL", "proveedor": "edX"},
-            {"habilidad": "Machine Learning", "titulo_curso": "ML Avanzado", "proveedor": "Udemy"}
-        ]
-
-    # Estilos CSS
-    st.markdown(r'''
+_CSS = r'''
     <style>
     body { background-color: #f5faff; }
     .main-card {
@@ -271,15 +413,107 @@ def main():
         border-left: 3px solid #00e6e6;
     }
     </style>
-    ''', unsafe_allow_html=True)
+    '''
 
-    # Header principal
-    st.markdown(r'''
-    <div class=\'main-card\'>
+_HEADER_HTML = r'''
+    <div class='main-card'>
         <h1>CogniLink UNRC</h1>
         <p style='font-size:1.2rem;'>Sistema inteligente de vinculación laboral para egresados UNRC.<br>Analiza tu CV y encuentra las mejores oportunidades.</p>
     </div>
-    ''', unsafe_allow_html=True)
+    '''
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cargar_vacantes_cursos():
+    """Carga vacantes y cursos una sola vez por sesión.
+
+    Sin el cache, cada rerun del script (cada clic) volvía a leer y
+    parsear ambos JSON desde disco.
+    """
+    try:
+        with open('vacantes.json', 'r', encoding='utf-8') as f:
+            VACANTES = json.load(f)
+        with open('cursos.json', 'r', encoding='utf-8') as f:
+            CURSOS = json.load(f)
+    except FileNotFoundError:
+        # Datos de ejemplo si no hay archivos
+        VACANTES = [
+            {
+                "id": 1,
+                "titulo": "Data Scientist",
+                "empresa": "Tech Solutions",
+                "descripcion": "Buscamos científico de datos con experiencia en Python y machine learning",
+                "requisitos_tecnicos": ["Python", "SQL", "Machine Learning", "Estadística"],
+                "requisitos_blandos": ["Trabajo en equipo", "Comunicación"]
+            },
+            {
+                "id": 2,
+                "titulo": "Desarrollador Full Stack",
+                "empresa": "Digital Labs",
+                "descripcion": "Desarrollador con conocimientos en JavaScript, Node.js y React",
+                "requisitos_tecnicos": ["JavaScript", "Node.js", "React", "SQL"],
+                "requisitos_blandos": ["Creatividad", "Resolución de problemas"]
+            }
+        ]
+        CURSOS = [
+            {"habilidad": "Python", "titulo_curso": "Curso intensivo de Python", "proveedor": "Coursera"},
+            {"habilidad": "SQL", "titulo_curso": "Bases de Datos SQL", "proveedor": "edX"},
+            {"habilidad": "Machine Learning", "titulo_curso": "ML Avanzado", "proveedor": "Udemy"}
+        ]
+    return VACANTES, CURSOS
+
+def main():
+    # Configuración de la página
+    st.set_page_config(page_title="CogniLink UNRC", layout="wide")
+
+    # Cargar datos (mock data o desde archivos, cacheados por sesión)
+    VACANTES, CURSOS = _cargar_vacantes_cursos()
+
+    # Estilos CSS y header (constantes de módulo: un solo st.markdown)
+    st.markdown(_CSS + _HEADER_HTML, unsafe_allow_html=True)
 
     # Sección de análisis de CV
-    st.markdown(
\ No newline at end of file
+    st.markdown("## 🔍 Análisis de CV")
+    cv_texto = st.text_area(
+        "Pega aquí el texto completo de tu CV:",
+        height=250,
+        help="Incluye tu experiencia, educación y habilidades"
+    )
+
+    if st.button("Analizar CV y buscar vacantes", type="primary"):
+        if not cv_texto.strip():
+            st.warning("Por favor, pega el texto de tu CV para analizarlo.")
+        else:
+            with st.spinner("Analizando CV y buscando vacantes..."):
+                resultados = aplicar_vacante_streamlit(cv_texto, VACANTES, CURSOS)
+
+            if not resultados:
+                st.info("No se encontraron vacantes para procesar.")
+            else:
+                # El HTML de todos los resultados se acumula en una lista y se
+                # emite con un solo join: sin cadenas intermedias y con una
+                # única llamada a st.markdown para toda la lista
+                partes = []
+                for res in resultados:
+                    vacante = res['vacante']
+                    partes.append("<div class='vacante-card'>")
+                    partes.append(f"<h3>{vacante['titulo']} — {vacante['empresa']}</h3>")
+                    partes.append(f"<p><b>Match:</b> {res['puntaje_match']}%</p>")
+                    partes.append(f"<p>{vacante['descripcion']}</p>")
+                    partes.append("<p>")
+                    for habilidad in res['habilidades_cumplidas']:
+                        partes.append(f"<span class='habilidad-cumplida'>{habilidad}</span>")
+                    for habilidad in res['habilidades_faltantes']:
+                        partes.append(f"<span class='habilidad-faltante'>{habilidad}</span>")
+                    partes.append("</p>")
+                    for curso in res['cursos_recomendados']:
+                        partes.append(
+                            "<div class='curso-card'>"
+                            f"<b>{curso['titulo_curso']}</b> — {curso['proveedor']} "
+                            f"(para {curso['habilidad']})</div>"
+                        )
+                    partes.append("</div>")
+                st.markdown("".join(partes), unsafe_allow_html=True)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,19 +1,67 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import date
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
 from textwrap import dedent
+import bisect
+import hashlib
+import hmac
+import html
+import numpy as np
 import streamlit as st
-import pandas as pd
 import json
 import re
-from flask import Flask, request, jsonify
-from flask_cors import CORS
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import requests
+import sys
 import time
 
+# Flask, sklearn y pandas se importan de forma diferida dentro de las
+# funciones que los usan: el arranque de Streamlit no paga su costo de
+# importación (sklearn solo agrega cientos de ms y decenas de MB).
+
+try:
+    import ahocorasick  # opcional: escaneo Aho-Corasick en una sola pasada
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # opcional: parser JSON en C, varias veces más rápido que el stdlib
+except ImportError:
+    orjson = None
+
+try:
+    import numba  # opcional: kernel JIT para el scoring denso de similitud
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _producto_denso(cv, V):
+        """Producto punto cv·V[i] para cada vacante, compilado por LLVM.
+
+        Las filas ya vienen normalizadas (norm='l2'), así que el producto es
+        directamente la similitud coseno; el bucle interno se auto-vectoriza
+        a instrucciones SIMD.
+        """
+        out = np.empty(V.shape[0], np.float32)
+        for i in numba.prange(V.shape[0]):
+            s = np.float32(0.0)
+            for j in range(V.shape[1]):
+                s += cv[j] * V[i, j]
+            out[i] = s
+        return out
+else:
+    _producto_denso = None
+
+
+def _leer_json(ruta):
+    """Lee y parsea un archivo JSON, con orjson cuando está disponible."""
+    datos = Path(ruta).read_bytes()
+    if orjson is not None:
+        return orjson.loads(datos)
+    return json.loads(datos)
+
 # ===============================
 # 📌 CONFIGURACIÓN Y CONSTANTES
 # ===============================
@@ -55,6 +103,12 @@ class OfertaDeTrabajo:
     empresa: str
     habilidades_requeridas: List[str] = field(default_factory=list)
     experiencia_minima_meses: int = 0
+    _habilidades_set: frozenset = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Las ofertas viven mucho tiempo y se comparan contra muchos
+        # candidatos: normalizar una sola vez al construir
+        self._habilidades_set = frozenset(h.lower() for h in self.habilidades_requeridas)
 
 
 @dataclass
@@ -66,42 +120,175 @@ class PerfilCandidato:
     resumen_profesional: str = ""
     habilidades: List[str] = field(default_factory=list)
     experiencias: List[ExperienciaLaboral] = field(default_factory=list)
+    _habilidades_lower: set = field(default_factory=set, repr=False)
+    _habilidades_sorted: List[str] = field(default_factory=list, repr=False)
+    # Fechas de experiencia codificadas como año*12+mes en arreglos int32;
+    # un fin negativo marca una experiencia en curso ("Actualidad")
+    _exp_start_ym: np.ndarray = field(init=False, repr=False)
+    _exp_end_ym: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._habilidades_lower = {h.lower() for h in self.habilidades}
+        self._habilidades_sorted = sorted(self.habilidades, key=str.lower)
+        # Orden descendente por fecha de inicio: el invariante sobre el que
+        # agregar_experiencia inserta con bisect
+        self.experiencias.sort(key=lambda exp: -exp.fecha_inicio.toordinal())
+        self._exp_start_ym = np.array(
+            [e.fecha_inicio.year * 12 + e.fecha_inicio.month for e in self.experiencias],
+            dtype=np.int32)
+        self._exp_end_ym = np.array(
+            [e.fecha_fin.year * 12 + e.fecha_fin.month if e.fecha_fin else -1
+             for e in self.experiencias],
+            dtype=np.int32)
 
     def get_experiencia_total_meses(self) -> int:
-        """Calcula los meses totales de experiencia del candidato."""
+        """Calcula los meses totales de experiencia del candidato.
+
+        Opera sobre los arreglos de fechas codificadas en una sola pasada
+        NumPy, en lugar de iterar experiencia por experiencia en Python.
+        """
         hoy = date.today()
-        total_meses = 0
-        for exp in self.experiencias:
-            fecha_fin = exp.fecha_fin or hoy
-            total_meses += (fecha_fin.year - exp.fecha_inicio.year) * 12 + (fecha_fin.month - exp.fecha_inicio.month)
-        return total_meses
+        fines = np.where(self._exp_end_ym < 0,
+                         hoy.year * 12 + hoy.month,
+                         self._exp_end_ym)
+        return int((fines - self._exp_start_ym).sum())
 
     def get_habilidades_normalizadas(self) -> List[str]:
         """Devuelve las habilidades en minúsculas para comparación."""
         return [h.lower() for h in self.habilidades]
 
+    def get_habilidades_ordenadas(self) -> List[str]:
+        """Devuelve las habilidades ordenadas alfabéticamente.
+
+        La vista ordenada se mantiene en cada alta, así el renderizado no
+        paga un sort con clave Python por llamada.
+        """
+        return self._habilidades_sorted
+
     def agregar_habilidad(self, habilidad: str) -> None:
         """Agrega una habilidad si no existe (ignorando mayúsculas/minúsculas)."""
-        if habilidad.lower() not in [h.lower() for h in self.habilidades]:
+        low = habilidad.lower()
+        if low not in self._habilidades_lower:
+            self._habilidades_lower.add(low)
             self.habilidades.append(habilidad)
+            bisect.insort(self._habilidades_sorted, habilidad, key=str.lower)
 
     def agregar_experiencia(self, experiencia: ExperienciaLaboral) -> None:
         """Agrega una experiencia laboral al perfil, ordenada por fecha."""
-        self.experiencias.append(experiencia)
-        self.experiencias.sort(key=lambda exp: exp.fecha_inicio, reverse=True)
+        # La lista se mantiene ordenada descendente; insertar con bisect evita
+        # re-ordenar todas las experiencias en cada alta
+        bisect.insort(self.experiencias, experiencia,
+                      key=lambda exp: -exp.fecha_inicio.toordinal())
+        fin = experiencia.fecha_fin
+        self._exp_start_ym = np.append(
+            self._exp_start_ym,
+            np.int32(experiencia.fecha_inicio.year * 12 + experiencia.fecha_inicio.month))
+        self._exp_end_ym = np.append(
+            self._exp_end_ym,
+            np.int32(fin.year * 12 + fin.month if fin else -1))
+
+    def mostrar_perfil(self) -> str:
+        """Devuelve el perfil completo como texto plano.
+
+        Acumula las líneas en una lista y hace un solo join al final:
+        tiempo lineal en el tamaño del perfil, sin concatenaciones
+        intermedias de cadenas.
+        """
+        partes = [f"Perfil de: {self.nombre}", f"Email: {self.email}"]
+        if self.telefono:
+            partes.append(f"Teléfono: {self.telefono}")
+        partes.extend(["", "--- Resumen Profesional ---", self.resumen_profesional,
+                       "", "--- Habilidades ---"])
+        if self.habilidades:
+            partes.append("- " + "\n- ".join(self._habilidades_sorted))
+        else:
+            partes.append("No hay habilidades registradas.")
+        partes.extend(["", "--- Experiencia Laboral ---"])
+        if self.experiencias:
+            partes.extend(str(exp) for exp in self.experiencias)
+        else:
+            partes.append("No hay experiencia registrada.")
+        return "\n".join(partes)
+
+
+def verificar_compatibilidad(perfil: PerfilCandidato, oferta: OfertaDeTrabajo) -> Tuple[float, set, set]:
+    """Compara las habilidades del candidato contra las requeridas por la oferta.
+
+    Opera sobre los conjuntos normalizados que ambos objetos mantienen desde
+    su construcción, sin reconstruir listas ni sets por llamada.
+    """
+    requeridas = oferta._habilidades_set
+    coincidentes = perfil._habilidades_lower & requeridas
+    faltantes = requeridas - perfil._habilidades_lower
+    porcentaje = len(coincidentes) / len(requeridas) if requeridas else 1.0
+    return porcentaje, coincidentes, faltantes
 
 
 # ===============================
 # 🎨 COMPONENTES DE UI
 # ===============================
 
-class UIComponents:
-    """Componentes reutilizables para la interfaz de usuario."""
-    
-    @staticmethod
-    def apply_custom_styles():
-        """Aplica estilos CSS personalizados a la aplicación."""
-        st.markdown("""
+# Plantilla precompilada de la tarjeta de perfil: format_map rellena los
+# huecos sin re-evaluar expresiones de f-string en cada llamada
+_PROFILE_TMPL = """
+    <div class='result-card'>
+        <div style='display: flex; align-items: center; margin-bottom: 1.5rem;'>
+            <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1rem; border-radius: 50%; margin-right: 1rem;'>
+                <span style='font-size: 1.5rem; color: white;'>👤</span>
+            </div>
+            <div>
+                <h2 style='color: #1e293b; margin: 0;'>Perfil Profesional</h2>
+                <p style='color: #64748b; margin: 0;'>Bienvenido/a al sistema</p>
+            </div>
+        </div>
+
+        <div style='display: grid; grid-template-columns: 1fr 1fr; gap: 1.5rem; margin-bottom: 1.5rem;'>
+            <div>
+                <h4 style='color: #667eea; margin-bottom: 0.5rem;'>📋 Información Personal</h4>
+                <p><b>Nombre:</b> {nombre}</p>
+                <p><b>ID:</b> {id_egresado}</p>
+                <p><b>Año de Egreso:</b> {anio_egreso}</p>
+            </div>
+            <div>
+                <h4 style='color: #667eea; margin-bottom: 0.5rem;'>🎯 Objetivos Profesionales</h4>
+                <p><b>Rol Deseado:</b> {rol_deseado}</p>
+                <p><b>Experiencia:</b> {experiencia_anios} años</p>
+            </div>
+        </div>
+    </div>
+    """
+
+@st.cache_data(show_spinner=False)
+def _render_profile_html(nombre, id_egresado, anio_egreso, rol_deseado, experiencia_anios):
+    """Genera el HTML de la tarjeta de perfil.
+
+    Streamlit re-ejecuta el script completo en cada interacción; cachear por
+    los datos del egresado evita reconstruir la misma cadena en cada rerun.
+    """
+    return _PROFILE_TMPL.format_map({
+        'nombre': nombre,
+        'id_egresado': id_egresado,
+        'anio_egreso': anio_egreso,
+        'rol_deseado': rol_deseado,
+        'experiencia_anios': experiencia_anios,
+    })
+
+@st.cache_data(show_spinner=False)
+def _skill_tags_html(skills, clase):
+    """Genera las etiquetas HTML de una lista de habilidades.
+
+    Cacheada por (lista, clase): las habilidades del egresado no cambian
+    durante la sesión y así el join + escape no se repite en cada rerun.
+    El escape evita que una habilidad con '<' o '&' rompa el markup.
+    """
+    return " ".join(
+        f"<span class='{clase}'>{html.escape(skill.strip())}</span>"
+        for skill in skills)
+
+# Bloques estáticos de CSS/HTML a nivel de módulo: Streamlit vuelve a
+# ejecutar el script en cada interacción y así no se reconstruyen las
+# cadenas en cada rerun (solo se reutiliza el mismo objeto str).
+_CUSTOM_STYLES_CSS = """
         <style>
         /* Estilos generales */
         .main {
@@ -246,12 +433,9 @@ class UIComponents:
             font-size: 1rem;
         }
         </style>
-        """, unsafe_allow_html=True)
-    
-    @staticmethod
-    def create_main_header():
-        """Crea el encabezado principal de la aplicación."""
-        st.markdown("""
+        """
+
+_MAIN_HEADER_HTML = """
         <div class='main-card'>
             <div style='display: flex; align-items: center; justify-content: center; margin-bottom: 1.5rem;'>
                 <div style='background: white; padding: 1rem; border-radius: 50%; margin-right: 1rem;'>
@@ -263,8 +447,37 @@ class UIComponents:
                 Sistema inteligente de vinculación laboral para egresados UNRC
             </p>
         </div>
-        """, unsafe_allow_html=True)
-    
+        """
+
+_ANALYSIS_HEADER_HTML = """
+        <div style='text-align: center; margin: 2rem 0;'>
+            <h2 style='color: #1e293b;'>🔍 Análisis Inteligente de CV</h2>
+            <p style='color: #64748b;'>
+                Obtén recomendaciones personalizadas de vacantes y cursos basadas en tu perfil
+            </p>
+        </div>
+        """
+
+_RESULTS_HEADER_HTML = """
+        <div style='text-align: center; margin: 2rem 0;'>
+            <h2 style='color: #1e293b;'>🎯 Resultados del Análisis</h2>
+            <p style='color: #64748b;'>Vacantes ordenadas por compatibilidad con tu perfil</p>
+        </div>
+        """
+
+class UIComponents:
+    """Componentes reutilizables para la interfaz de usuario."""
+
+    @staticmethod
+    def apply_custom_styles():
+        """Aplica estilos CSS personalizados a la aplicación."""
+        st.markdown(_CUSTOM_STYLES_CSS, unsafe_allow_html=True)
+
+    @staticmethod
+    def create_main_header():
+        """Crea el encabezado principal de la aplicación."""
+        st.markdown(_MAIN_HEADER_HTML, unsafe_allow_html=True)
+
     @staticmethod
     def create_login_form():
         """Crea el formulario de login."""
@@ -297,33 +510,16 @@ class UIComponents:
     @staticmethod
     def create_user_profile_card(user_data):
         """Crea una tarjeta con el perfil del usuario."""
-        st.markdown(f"""
-        <div class='result-card'>
-            <div style='display: flex; align-items: center; margin-bottom: 1.5rem;'>
-                <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1rem; border-radius: 50%; margin-right: 1rem;'>
-                    <span style='font-size: 1.5rem; color: white;'>👤</span>
-                </div>
-                <div>
-                    <h2 style='color: #1e293b; margin: 0;'>Perfil Profesional</h2>
-                    <p style='color: #64748b; margin: 0;'>Bienvenido/a al sistema</p>
-                </div>
-            </div>
-            
-            <div style='display: grid; grid-template-columns: 1fr 1fr; gap: 1.5rem; margin-bottom: 1.5rem;'>
-                <div>
-                    <h4 style='color: #667eea; margin-bottom: 0.5rem;'>📋 Información Personal</h4>
-                    <p><b>Nombre:</b> {user_data['Nombre']}</p>
-                    <p><b>ID:</b> {user_data['ID_Egresado']}</p>
-                    <p><b>Año de Egreso:</b> {user_data['Anio_Egreso']}</p>
-                </div>
-                <div>
-                    <h4 style='color: #667eea; margin-bottom: 0.5rem;'>🎯 Objetivos Profesionales</h4>
-                    <p><b>Rol Deseado:</b> {user_data['Rol_Deseado']}</p>
-                    <p><b>Experiencia:</b> {user_data['Experiencia_Anios']} años</p>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(
+            _render_profile_html(
+                user_data['Nombre'],
+                user_data['ID_Egresado'],
+                user_data['Anio_Egreso'],
+                user_data['Rol_Deseado'],
+                user_data['Experiencia_Anios'],
+            ),
+            unsafe_allow_html=True,
+        )
     
     @staticmethod
     def create_skills_section(hard_skills, soft_skills):
@@ -333,16 +529,16 @@ class UIComponents:
         with col1:
             st.markdown("### 🛠️ Hard Skills")
             if hard_skills:
-                skills_html = " ".join([f"<span class='skill-match'>{skill}</span>" for skill in hard_skills])
-                st.markdown(skills_html, unsafe_allow_html=True)
+                st.markdown(_skill_tags_html(tuple(hard_skills), 'skill-match'),
+                            unsafe_allow_html=True)
             else:
                 st.info("No hay hard skills registradas")
-        
+
         with col2:
             st.markdown("### 💬 Soft Skills")
             if soft_skills:
-                skills_html = " ".join([f"<span class='skill-neutral'>{skill}</span>" for skill in soft_skills])
-                st.markdown(skills_html, unsafe_allow_html=True)
+                st.markdown(_skill_tags_html(tuple(soft_skills), 'skill-neutral'),
+                            unsafe_allow_html=True)
             else:
                 st.info("No hay soft skills registradas")
     
@@ -350,14 +546,7 @@ class UIComponents:
     def create_analysis_section():
         """Crea la sección de análisis de CV."""
         st.markdown("---")
-        st.markdown("""
-        <div style='text-align: center; margin: 2rem 0;'>
-            <h2 style='color: #1e293b;'>🔍 Análisis Inteligente de CV</h2>
-            <p style='color: #64748b;'>
-                Obtén recomendaciones personalizadas de vacantes y cursos basadas en tu perfil
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_ANALYSIS_HEADER_HTML, unsafe_allow_html=True)
         
         cv_text = st.text_area(
             "📄 Pega aquí el texto de tu CV:",
@@ -384,16 +573,14 @@ class UIComponents:
             return
         
         st.markdown("---")
-        st.markdown("""
-        <div style='text-align: center; margin: 2rem 0;'>
-            <h2 style='color: #1e293b;'>🎯 Resultados del Análisis</h2>
-            <p style='color: #64748b;'>Vacantes ordenadas por compatibilidad con tu perfil</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_RESULTS_HEADER_HTML, unsafe_allow_html=True)
         
         for i, result in enumerate(results, 1):
             with st.container():
-                st.markdown(f"""
+                # Todo el HTML del resultado (tarjeta + cursos) se acumula y
+                # se emite en una sola llamada: una actualización de frontend
+                # por vacante en lugar de 2 + una por curso
+                partes = [f"""
                 <div class='result-card'>
                     <div style='display: flex; justify-content: space-between; align-items: start; margin-bottom: 1rem;'>
                         <div>
@@ -415,22 +602,23 @@ class UIComponents:
                         {' '.join([f"<span class='skill-missing'>{skill}</span>" for skill in result['habilidades_faltantes']]) if result['habilidades_faltantes'] else '<p style=\"color: #64748b;\">¡Excelente! Cumples con todos los requisitos</p>'}
                     </div>
                 </div>
-                """, unsafe_allow_html=True)
-                
+                """]
+
                 # Cursos recomendados
                 if result['cursos_recomendados']:
-                    st.markdown("#### 🎓 Cursos Recomendados")
+                    partes.append("<h4>🎓 Cursos Recomendados</h4>")
                     for curso in result['cursos_recomendados']:
-                        st.markdown(f"""
+                        partes.append(f"""
                         <div class='course-card'>
                             <h5 style='color: #1e293b; margin: 0 0 0.5rem 0;'>{curso['titulo_curso']}</h5>
                             <p style='color: #64748b; margin: 0 0 0.5rem 0;'>
-                                <b>Proveedor:</b> {curso['proveedor']} | 
+                                <b>Proveedor:</b> {curso['proveedor']} |
                                 <b>Habilidad:</b> {curso['habilidad']}
                             </p>
                         </div>
-                        """, unsafe_allow_html=True)
-                
+                        """)
+                st.markdown("".join(partes), unsafe_allow_html=True)
+
                 # Botones de acción
                 col1, col2, col3 = st.columns(3)
                 with col1:
@@ -464,17 +652,27 @@ class DataService:
     """Servicio para manejar datos y operaciones relacionadas."""
     
     @staticmethod
+    @st.cache_data(ttl=3600, show_spinner=False)
     def load_sample_data():
-        """Carga datos de ejemplo para demostración."""
+        """Carga datos de ejemplo para demostración.
+
+        Cacheada: cada interacción re-ejecuta el script completo y sin el
+        cache cada rerun volvería a consultar la base de datos.
+        """
+        import pandas as pd
+
         try:
             from db_utils import cargar_tabla
-            df_egresados = cargar_tabla('egresados')
-            df_ofertas = cargar_tabla('ofertas')
-            df_habilidades = cargar_tabla('habilidades')
-            return df_egresados, df_ofertas, df_habilidades
+            # Proyección de columnas: el login y el dashboard solo leen
+            # estos campos, el resto ni se transfiere desde Postgres
+            df_egresados = cargar_tabla('egresados', columnas=[
+                'ID_Egresado', 'Nombre', 'Anio_Egreso', 'Rol_Deseado',
+                'Experiencia_Anios', 'Hard_Skills', 'Soft_Skills'])
+            df_ofertas = cargar_tabla('ofertas', columnas=[
+                'Puesto', 'Empresa', 'Req_Hard_Skills'])
         except ImportError:
             # Datos de ejemplo
-            return (
+            df_egresados, df_ofertas = (
                 pd.DataFrame([{
                     'ID_Egresado': 'UNRC123',
                     'Nombre': 'María González',
@@ -492,13 +690,32 @@ class DataService:
                     'Req_Hard_Skills': 'Python, Django, PostgreSQL, AWS',
                     'Req_Soft_Skills': 'Liderazgo, Comunicación',
                     'Descripcion_Puesto': 'Desarrollo de aplicaciones empresariales escalables'
-                }]),
-                pd.DataFrame()
+                }])
             )
+        # Índice hash por ID: el login pasa de un escaneo lineal con
+        # astype(str) por intento a una búsqueda .loc en O(1)
+        df_egresados['ID_Egresado'] = df_egresados['ID_Egresado'].astype('string')
+        df_egresados = df_egresados.set_index('ID_Egresado', drop=False)
+        # La credencial de demo (el nombre normalizado) se guarda solo como
+        # hash BLAKE2b: el login compara digests en lugar de re-normalizar
+        # la cadena almacenada en cada intento
+        df_egresados['_pw_hash'] = df_egresados['Nombre'].str.strip().str.lower().map(
+            lambda s: hashlib.blake2b(s.encode(), digest_size=16).digest())
+        # Las listas de habilidades vienen como CSV dentro de la celda; se
+        # parsean una sola vez aquí para que el dashboard lea listas ya hechas
+        for col in ('Hard_Skills', 'Soft_Skills'):
+            if col in df_egresados.columns:
+                df_egresados[col] = df_egresados[col].str.split(r'\s*,\s*', regex=True)
+        return df_egresados, df_ofertas
     
     @staticmethod
+    @st.cache_data(show_spinner=False)
     def analyze_cv_with_api(cv_text):
-        """Analiza el CV utilizando la API Flask."""
+        """Analiza el CV utilizando la API Flask.
+
+        Se cachea por texto de CV para que un rerun del script (o un clic
+        repetido con el mismo texto) no vuelva a pagar el análisis completo.
+        """
         try:
             # Simular llamada a API (en producción sería una llamada real)
             time.sleep(2)  # Simular procesamiento
@@ -556,56 +773,109 @@ class DataService:
 # 🧠 FUNCIONES NLP (mantenidas del código original)
 # ===============================
 
+_SINONIMOS = {
+    'estadistica': 'estadística',
+    'equipo': 'trabajo en equipo',
+    'resolucion de problemas': 'resolución de problemas',
+}
+_CANON_RE = re.compile(
+    r'\b(estad[ií]stica|trabajo en equipo|equipo|resoluci[oó]n de problemas|'
+    r'python|sql|excel|javascript|node\.js|google ads|seo|docker|liderazgo)\b'
+)
+
+@lru_cache(maxsize=4096)
 def normalizar_habilidad(habilidad):
-    """Limpia la habilidad y maneja sinónimos básicos y versiones."""
-    habilidad = habilidad.lower().strip()
-    if 'estadistica' in habilidad:
-        return 'estadística'
-    if 'trabajo en equipo' in habilidad or 'equipo' in habilidad:
-        return 'trabajo en equipo'
-    if 'resolución' in habilidad and 'problemas' in habilidad:
-        return 'resolución de problemas'
-    terminos_clave = ['python', 'sql', 'excel', 'javascript', 'node.js', 'google ads', 'seo', 'docker', 'liderazgo']
-    for termino in terminos_clave:
-        if termino in habilidad:
-            return termino
-    return habilidad
-
-def extraer_habilidades(cv_texto, lista_habilidades_conocidas):
-    """Procesa el texto del CV y busca coincidencias con las habilidades conocidas."""
-    habilidades_encontradas = set()
-    habilidades_normalizadas = [normalizar_habilidad(h) for h in lista_habilidades_conocidas]
-    cv_texto_limpio = normalizar_habilidad(cv_texto)
-    for habilidad in habilidades_normalizadas:
-        if habilidad in cv_texto_limpio:
-            habilidades_encontradas.add(habilidad)
-    return habilidades_encontradas
-
-def calcular_similitud_tfidf(cv_texto, vacantes):
-    """Calcula la similitud coseno entre el texto del CV y la descripción de cada vacante."""
-    documentos = [cv_texto] + [v['descripcion'] for v in vacantes]
-    vectorizer = TfidfVectorizer(stop_words='english', lowercase=True)
-    tfidf_matrix = vectorizer.fit_transform(documentos)
-    cosine_sim = cosine_similarity(tfidf_matrix[0], tfidf_matrix[1:])
-    scores = cosine_sim[0]
-    tfidf_scores = {}
-    for i, score in enumerate(scores):
-        vacante_id = vacantes[i]['id']
-        tfidf_scores[vacante_id] = score
-    return tfidf_scores
+    """Limpia la habilidad y maneja sinónimos básicos y versiones.
+
+    Una sola búsqueda con regex compilada reemplaza la cascada de
+    comprobaciones de subcadena; el resultado se memoiza porque las mismas
+    cadenas se repiten entre vacantes y peticiones.
+    """
+    s = habilidad.lower().strip()
+    m = _CANON_RE.search(s)
+    if m is None:
+        return s
+    return _SINONIMOS.get(m.group(1), m.group(1))
+
+def extraer_habilidades(cv_texto):
+    """Busca todas las habilidades conocidas en el texto del CV en una sola pasada.
+
+    El vocabulario de habilidades se compila una vez al cargar los datos
+    (ver `_build_skill_scanner`); aquí sólo se recorre el texto del CV.
+    """
+    # Solo minúsculas: normalizar_habilidad es para habilidades sueltas y
+    # colapsaba el CV completo a su primer término canónico, dejando al
+    # escáner sin el resto del texto (y llenando su lru_cache de CVs)
+    cv_texto_limpio = cv_texto.lower()
+    if _SKILL_AUTOMATON is not None:
+        return {habilidad for _, habilidad in _SKILL_AUTOMATON.iter(cv_texto_limpio)}
+    if _SKILL_RE is not None:
+        return set(_SKILL_RE.findall(cv_texto_limpio))
+    return set()
+
+def calcular_similitud_tfidf(cv_texto):
+    """Calcula la similitud coseno entre el texto del CV y la descripción de cada vacante.
+
+    El vectorizador se ajusta una sola vez al cargar los datos (ver
+    `_build_tfidf_index`); por petición sólo se transforma el CV y se hace un
+    producto punto disperso contra la matriz ya normalizada.
+    """
+    if VACANTE_VECTORIZER is None:
+        _build_tfidf_index()
+    if VACANTE_VECTORIZER is None:
+        return {}
+    cv_vec = VACANTE_VECTORIZER.transform([cv_texto])
+    if VACANTE_DENSE is not None:
+        scores = _producto_denso(cv_vec.toarray().astype(np.float32)[0], VACANTE_DENSE)
+    else:
+        scores = (cv_vec @ VACANTE_TFIDF.T).toarray()[0]
+    return {v.id: score for v, score in zip(VACANTES, scores)}
 
 
 # ===============================
 # 🚀 APLICACIÓN PRINCIPAL
 # ===============================
 
+@st.cache_data(show_spinner=False)
+def _ofertas_relacionadas(df_ofertas, rol_palabra, habilidad):
+    """Filtra las ofertas afines al rol deseado o a la primera hard skill.
+
+    Cacheada por (tabla, rol, habilidad): los dos escaneos de columnas no se
+    repiten en cada rerun, y regex=False usa búsqueda de subcadena en C en
+    lugar del motor de expresiones regulares.
+    """
+    if df_ofertas.empty or not (rol_palabra or habilidad):
+        return []
+    # na=False: una celda NULL en la tabla no debe propagar NaN a la
+    # máscara (loc rechaza máscaras con NA), solo quedar fuera del filtro
+    mask = df_ofertas['Puesto'].str.contains(rol_palabra or habilidad,
+                                             case=False, regex=False, na=False)
+    if habilidad:
+        mask |= df_ofertas['Req_Hard_Skills'].str.contains(habilidad,
+                                                           case=False, regex=False,
+                                                           na=False)
+    return df_ofertas.loc[mask].to_dict('records')
+
+
+@st.cache_data(show_spinner=False)
+def _indice_credenciales(df_egresados):
+    """Diccionario ID → hash de credencial.
+
+    Saca a pandas por completo de la ruta de autenticación: verificar un
+    intento es un get de dict más la comparación de digests.
+    """
+    return dict(zip(df_egresados.index, df_egresados['_pw_hash']))
+
+
 class CogniLinkApp:
     """Clase principal que maneja la aplicación Streamlit."""
     
     def __init__(self):
         self.ui = UIComponents()
         self.data_service = DataService()
-        self.df_egresados, self.df_ofertas, self.df_habilidades = self.data_service.load_sample_data()
+        # La tabla de habilidades no se usa en el flujo de login/dashboard;
+        # no cargarla ahorra una consulta por sesión
+        self.df_egresados, self.df_ofertas = self.data_service.load_sample_data()
     
     def run(self):
         """Ejecuta la aplicación principal."""
@@ -646,21 +916,26 @@ class CogniLinkApp:
             st.error("❌ Por favor, completa todos los campos")
             return
         
-        # Buscar usuario
-        egresado = self.df_egresados[
-            self.df_egresados['ID_Egresado'].astype(str) == id_input
-        ]
-        
-        if not egresado.empty:
-            # En una aplicación real, aquí verificarías la contraseña correctamente
-            if egresado.iloc[0]['Nombre'].strip().lower() == password_input.strip().lower():
-                st.session_state[SESSION_KEYS['user']] = egresado.iloc[0].to_dict()
-                st.success(f"🎉 ¡Bienvenido/a, {egresado.iloc[0]['Nombre']}!")
-                st.rerun()
-            else:
-                st.error("❌ Contraseña incorrecta")
-        else:
+        # Verificación contra el índice de credenciales (dict puro, sin pandas)
+        hash_esperado = _indice_credenciales(self.df_egresados).get(id_input)
+        if hash_esperado is None:
             st.error("❌ ID de egresado no encontrado")
+            return
+
+        # Comparación de digests en tiempo constante; el hash almacenado se
+        # calculó una sola vez al cargar la tabla
+        pw_hash = hashlib.blake2b(
+            password_input.strip().lower().encode(), digest_size=16).digest()
+        if hmac.compare_digest(hash_esperado, pw_hash):
+            # La fila se materializa una sola vez como dict: cada lectura
+            # posterior es un acceso de dict, no indexación de pandas
+            datos = self.df_egresados.loc[id_input].to_dict()
+            datos.pop('_pw_hash', None)
+            st.session_state[SESSION_KEYS['user']] = datos
+            st.success(f"🎉 ¡Bienvenido/a, {datos['Nombre']}!")
+            st.rerun()
+        else:
+            st.error("❌ Contraseña incorrecta")
     
     def show_dashboard(self):
         """Muestra el dashboard principal después del login."""
@@ -678,14 +953,37 @@ class CogniLinkApp:
         # Perfil del usuario
         self.ui.create_user_profile_card(user_data)
         
-        # Habilidades
-        hard_skills = [h.strip() for h in user_data['Hard_Skills'].split(',')]
-        soft_skills = [s.strip() for s in user_data['Soft_Skills'].split(',')]
-        self.ui.create_skills_section(hard_skills, soft_skills)
+        # Habilidades (ya parseadas como listas al cargar la tabla)
+        hard_skills = user_data['Hard_Skills']
+        self.ui.create_skills_section(hard_skills, user_data['Soft_Skills'])
+
+        # Ofertas relacionadas con el perfil (filtro cacheado)
+        rol = user_data.get('Rol_Deseado') or ''
+        relacionadas = _ofertas_relacionadas(
+            self.df_ofertas,
+            rol.split()[0] if rol else '',
+            hard_skills[0] if hard_skills else '')
+        if relacionadas:
+            partes = ["### 💼 Ofertas relacionadas con tu perfil\n"]
+            partes.extend(
+                f"- **{oferta['Puesto']}** — {oferta['Empresa']}\n"
+                for oferta in relacionadas
+            )
+            st.markdown("".join(partes))
         
-        # Sección de análisis
+        # Sección de análisis y resultados (fragmento aislado)
+        self.show_analysis_panel()
+
+    @st.fragment
+    def show_analysis_panel(self):
+        """Muestra la sección de análisis de CV y sus resultados.
+
+        Al estar decorada con st.fragment, pulsar "Analizar" re-ejecuta solo
+        este panel: el login, el perfil y las habilidades del dashboard no
+        se vuelven a renderizar en cada análisis.
+        """
         cv_text, analyze_btn = self.ui.create_analysis_section()
-        
+
         # Manejar análisis
         if analyze_btn:
             if not cv_text.strip():
@@ -695,7 +993,7 @@ class CogniLinkApp:
                     results = self.data_service.analyze_cv_with_api(cv_text)
                     st.session_state[SESSION_KEYS['results']] = results
                     st.session_state[SESSION_KEYS['cv_text']] = cv_text
-        
+
         # Mostrar resultados si existen
         if SESSION_KEYS['results'] in st.session_state:
             self.ui.create_results_section(st.session_state[SESSION_KEYS['results']])
@@ -705,20 +1003,119 @@ class CogniLinkApp:
 # 🌐 CONFIGURACIÓN FLASK (mantenida del código original)
 # ===============================
 
-app = Flask(__name__)
-CORS(app)
+class Vacante(NamedTuple):
+    """Registro ligero de vacante.
+
+    El acceso por atributo en un NamedTuple es una indexación de tupla a
+    offset fijo — más barato y más amigable con la caché que cinco búsquedas
+    de hash en un dict por vacante en el bucle caliente.
+    """
+    id: str
+    titulo: str
+    empresa: str
+    descripcion: str
+    requisitos_tecnicos: tuple
+    requisitos_blandos: tuple
+
 
-VACANTES: List[dict] = []
+VACANTES: List[Vacante] = []
 CURSOS: List[dict] = []
+VACANTE_VECTORIZER = None
+VACANTE_TFIDF = None
+VACANTE_DENSE = None  # copia densa float32 de VACANTE_TFIDF para el kernel numba
+# Por encima de este vocabulario la copia densa deja de valer la pena
+# (memoria y ancho de banda superan el costo del camino disperso de sklearn)
+_DENSE_MAX_TERMS = 5000
+TODAS_HABILIDADES: frozenset = frozenset()
+_SKILL_AUTOMATON = None
+_SKILL_RE = None
+SKILL_INDEX: dict = {}
+SKILL_VOCAB = None   # habilidades normalizadas e internadas, alineado con SKILL_INDEX
+REQ_MATRIX = None    # bool (vacantes, habilidades): la vacante i requiere la habilidad j
+REQ_COUNTS = None
+_CURSO_INDEX: dict = {}
+
+def _build_curso_index():
+    """Indexa los cursos por habilidad normalizada para buscarlos en O(1)."""
+    global _CURSO_INDEX
+    _CURSO_INDEX = {}
+    for curso in CURSOS:
+        _CURSO_INDEX.setdefault(normalizar_habilidad(curso['habilidad']), []).append(curso)
+
+def _build_req_matrix():
+    """Codifica los requisitos de cada vacante como máscaras booleanas sobre el vocabulario.
+
+    Con esto el scoring por petición son unas pocas operaciones NumPy sobre
+    toda la matriz en lugar de intersecciones de sets vacante por vacante.
+    """
+    global SKILL_INDEX, SKILL_VOCAB, REQ_MATRIX, REQ_COUNTS
+    SKILL_INDEX = {h: i for i, h in enumerate(sorted(TODAS_HABILIDADES))}
+    if not VACANTES or not SKILL_INDEX:
+        SKILL_VOCAB = None
+        REQ_MATRIX = None
+        REQ_COUNTS = None
+        return
+    # Lista de str internadas (no ndarray de unicode): decodificar una máscara
+    # devuelve referencias compartidas en lugar de copias nuevas por petición
+    SKILL_VOCAB = sorted(TODAS_HABILIDADES)
+    REQ_MATRIX = np.zeros((len(VACANTES), len(SKILL_INDEX)), dtype=bool)
+    for i, v in enumerate(VACANTES):
+        for h in v.requisitos_tecnicos + v.requisitos_blandos:
+            REQ_MATRIX[i, SKILL_INDEX[normalizar_habilidad(h)]] = True
+    REQ_COUNTS = REQ_MATRIX.sum(axis=1)
+
+def _build_skill_scanner():
+    """Compila el vocabulario de habilidades de las vacantes para buscarlo en una pasada."""
+    global TODAS_HABILIDADES, _SKILL_AUTOMATON, _SKILL_RE
+    habilidades = set()
+    for v in VACANTES:
+        habilidades.update(v.requisitos_tecnicos)
+        habilidades.update(v.requisitos_blandos)
+    # sys.intern: las mismas cadenas normalizadas se comparten entre
+    # peticiones y las operaciones de hash reutilizan el hash cacheado
+    TODAS_HABILIDADES = frozenset(sys.intern(normalizar_habilidad(h)) for h in habilidades)
+    _SKILL_AUTOMATON = None
+    _SKILL_RE = None
+    if not TODAS_HABILIDADES:
+        return
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for habilidad in TODAS_HABILIDADES:
+            automaton.add_word(habilidad, habilidad)
+        automaton.make_automaton()
+        _SKILL_AUTOMATON = automaton
+    else:
+        # Alternativa sin dependencias: una sola alternancia compilada (las
+        # habilidades más largas primero para que ganen sobre sus prefijos)
+        patron = '|'.join(re.escape(h) for h in sorted(TODAS_HABILIDADES, key=len, reverse=True))
+        _SKILL_RE = re.compile(patron)
+
+def _build_tfidf_index():
+    """Ajusta el vectorizador TF-IDF una sola vez sobre las descripciones de las vacantes."""
+    global VACANTE_VECTORIZER, VACANTE_TFIDF, VACANTE_DENSE
+    if not VACANTES:
+        VACANTE_VECTORIZER = None
+        VACANTE_TFIDF = None
+        VACANTE_DENSE = None
+        return
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    # norm='l2' (default) deja la matriz lista para similitud coseno vía producto punto
+    VACANTE_VECTORIZER = TfidfVectorizer(stop_words='english', lowercase=True, sublinear_tf=True)
+    VACANTE_TFIDF = VACANTE_VECTORIZER.fit_transform([v.descripcion for v in VACANTES])
+    # Con numba disponible y vocabulario acotado, una copia densa float32
+    # habilita el kernel JIT por petición
+    if _producto_denso is not None and VACANTE_TFIDF.shape[1] <= _DENSE_MAX_TERMS:
+        VACANTE_DENSE = VACANTE_TFIDF.toarray().astype(np.float32)
+    else:
+        VACANTE_DENSE = None
 
 def _load_global_data():
     """Carga datos globales para la API Flask."""
     global VACANTES, CURSOS
     try:
-        with open('vacantes.json', 'r', encoding='utf-8') as f:
-            VACANTES = json.load(f)
-        with open('cursos.json', 'r', encoding='utf-8') as f:
-            CURSOS = json.load(f)
+        VACANTES = _leer_json('vacantes.json')
+        CURSOS = _leer_json('cursos.json')
     except FileNotFoundError:
         VACANTES = [{
             "id": 1,
@@ -732,67 +1129,123 @@ def _load_global_data():
             {"habilidad": "Python", "titulo_curso": "Curso intensivo de Python", "proveedor": "Coursera"},
             {"habilidad": "SQL", "titulo_curso": "Introducción a SQL", "proveedor": "edX"}
         ]
+    # Los dicts del JSON se convierten una sola vez en registros compactos
+    VACANTES = [
+        Vacante(
+            id=v['id'],
+            titulo=v['titulo'],
+            empresa=v['empresa'],
+            descripcion=v['descripcion'],
+            requisitos_tecnicos=tuple(v['requisitos_tecnicos']),
+            requisitos_blandos=tuple(v['requisitos_blandos']),
+        )
+        for v in VACANTES
+    ]
+    _build_skill_scanner()
+    _build_req_matrix()
+    _build_curso_index()
+    # El índice TF-IDF se construye de forma perezosa en la primera similitud:
+    # así la ruta Streamlit ni siquiera importa sklearn.
+    global VACANTE_VECTORIZER, VACANTE_TFIDF, VACANTE_DENSE
+    VACANTE_VECTORIZER = None
+    VACANTE_TFIDF = None
+    VACANTE_DENSE = None
 
 _load_global_data()
 
-@app.route('/aplicar', methods=['POST'])
-def aplicar_vacante():
-    """Endpoint para análisis de CV."""
-    data = request.json
-    cv_texto = data.get('cv_texto', '')
-    
-    if not cv_texto:
-        return jsonify({"error": "No se proporcionó texto de CV"}), 400
-    
-    # Implementación del análisis (simplificada para el ejemplo)
-    resultados = []
-    todas_habilidades = set()
-    for v in VACANTES:
-        todas_habilidades.update(v['requisitos_tecnicos'])
-        todas_habilidades.update(v['requisitos_blandos'])
-    
-    habilidades_cv = extraer_habilidades(cv_texto, todas_habilidades)
-    tfidf_scores = calcular_similitud_tfidf(cv_texto, VACANTES)
-    
-    for vacante in VACANTES:
-        req_tec = set(normalizar_habilidad(h) for h in vacante['requisitos_tecnicos'])
-        req_blando = set(normalizar_habilidad(h) for h in vacante['requisitos_blandos'])
-        req_totales = req_tec.union(req_blando)
-        
-        habilidades_cumplidas = habilidades_cv.intersection(req_totales)
-        habilidades_faltantes = req_totales - habilidades_cv
-        
-        total_req = len(req_totales)
-        score_cumplimiento = len(habilidades_cumplidas) / total_req if total_req else 0
-        score_relevancia = tfidf_scores.get(vacante['id'], 0)
-        puntaje_final = (score_cumplimiento * 0.6) + (score_relevancia * 0.4)
-        
-        cursos_recomendados = [
-            curso for curso in CURSOS
-            if normalizar_habilidad(curso['habilidad']) in habilidades_faltantes
-        ]
-        
-        resultados.append({
-            "vacante_id": vacante['id'],
-            "titulo": vacante['titulo'],
-            "empresa": vacante['empresa'],
-            "puntaje_match": round(puntaje_final * 100, 2),
-            "habilidades_cumplidas": list(habilidades_cumplidas),
-            "habilidades_faltantes": list(habilidades_faltantes),
-            "cursos_recomendados": cursos_recomendados
+def crear_api():
+    """Construye la aplicación Flask bajo demanda.
+
+    Flask y flask_cors se importan aquí para que el proceso Streamlit no
+    cargue la pila web que nunca usa.
+    """
+    from flask import Flask, request, jsonify
+    from flask_cors import CORS
+
+    app = Flask(__name__)
+    CORS(app)
+    app.json.compact = True  # respuestas sin espacios de relleno
+    try:
+        from flask_compress import Compress
+        Compress(app)  # las listas grandes de /aplicar viajan comprimidas
+    except ImportError:
+        pass
+
+    @app.route('/aplicar', methods=['POST'])
+    def aplicar_vacante():
+        """Endpoint para análisis de CV."""
+        data = request.json
+        cv_texto = data.get('cv_texto', '')
+
+        if not cv_texto:
+            return jsonify({"error": "No se proporcionó texto de CV"}), 400
+
+        if REQ_MATRIX is None:
+            return jsonify([])
+
+        habilidades_cv = extraer_habilidades(cv_texto)
+        tfidf_scores = calcular_similitud_tfidf(cv_texto)
+
+        # Codifica las habilidades del CV como máscara y puntúa todas las
+        # vacantes de una vez con operaciones vectorizadas
+        cv_mask = np.zeros(len(SKILL_INDEX), dtype=bool)
+        for habilidad in habilidades_cv:
+            idx = SKILL_INDEX.get(habilidad)
+            if idx is not None:
+                cv_mask[idx] = True
+
+        cumplidas = REQ_MATRIX & cv_mask
+        faltantes = REQ_MATRIX & ~cv_mask
+        score_cumplimiento = cumplidas.sum(axis=1) / np.maximum(REQ_COUNTS, 1)
+        score_relevancia = np.array([tfidf_scores.get(v.id, 0.0) for v in VACANTES])
+        puntajes = (score_cumplimiento * 0.6) + (score_relevancia * 0.4)
+
+        # Los clientes normalmente solo quieren los mejores matches: se
+        # seleccionan los K mayores con una partición parcial y el JSON se
+        # construye únicamente para esos
+        try:
+            top_k = int(request.args.get('k', 20))
+        except ValueError:
+            top_k = 20
+        top_k = max(1, min(top_k, len(VACANTES)))
+        if top_k < len(VACANTES):
+            candidatos = np.argpartition(-puntajes, top_k)[:top_k]
+        else:
+            candidatos = np.arange(len(VACANTES))
+
+        resultados = []
+        for i in candidatos:
+            vacante = VACANTES[i]
+            habilidades_faltantes = [SKILL_VOCAB[j] for j in np.flatnonzero(faltantes[i])]
+
+            cursos_recomendados = [
+                curso for habilidad in habilidades_faltantes
+                for curso in _CURSO_INDEX.get(habilidad, ())
+            ]
+
+            resultados.append({
+                "vacante_id": vacante.id,
+                "titulo": vacante.titulo,
+                "empresa": vacante.empresa,
+                "puntaje_match": round(float(puntajes[i]) * 100, 2),
+                "habilidades_cumplidas": [SKILL_VOCAB[j] for j in np.flatnonzero(cumplidas[i])],
+                "habilidades_faltantes": habilidades_faltantes,
+                "cursos_recomendados": cursos_recomendados
+            })
+
+        return jsonify(sorted(resultados, key=lambda x: x['puntaje_match'], reverse=True))
+
+    @app.route('/health', methods=['GET'])
+    def health_check():
+        """Health check endpoint."""
+        return jsonify({
+            "status": "ok",
+            "message": "API CogniLink funcionando",
+            "vacantes_cargadas": len(VACANTES),
+            "cursos_cargados": len(CURSOS)
         })
-    
-    return jsonify(sorted(resultados, key=lambda x: x['puntaje_match'], reverse=True))
-
-@app.route('/health', methods=['GET'])
-def health_check():
-    """Health check endpoint."""
-    return jsonify({
-        "status": "ok", 
-        "message": "API CogniLink funcionando",
-        "vacantes_cargadas": len(VACANTES),
-        "cursos_cargados": len(CURSOS)
-    })
+
+    return app
 
 
 # ===============================
@@ -803,8 +1256,16 @@ if __name__ == "__main__":
     import sys
     
     if len(sys.argv) > 1 and sys.argv[1] == "api":
-        print("🚀 Iniciando API Flask en http://0.0.0.0:5000")
-        app.run(host='0.0.0.0', port=5000, debug=True)
+        api = crear_api()
+        try:
+            # Servidor WSGI de producción: multihilo, sin las limitaciones
+            # del servidor de desarrollo de Flask
+            from waitress import serve
+            print("🚀 Iniciando API Flask (waitress) en http://0.0.0.0:5000")
+            serve(api, host='0.0.0.0', port=5000, threads=8)
+        except ImportError:
+            print("🚀 Iniciando API Flask en http://0.0.0.0:5000")
+            api.run(host='0.0.0.0', port=5000, debug=True)
     else:
         print("🎯 Iniciando aplicación Streamlit")
         app_instance = CogniLinkApp()
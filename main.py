@@ -1,10 +1,41 @@
 from flask import Flask, request, jsonify
-from flask_cors import CORS 
+from flask_cors import CORS
 import json
+import os
 import re
+from functools import lru_cache
+import numpy as np
+from joblib import Parallel, delayed
+
+# Acelerador opcional: con pyahocorasick instalado el CV se escanea en una
+# pasada lineal; si falta, se usa una alternancia regex compilada una vez
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Acelerador opcional: kernel JIT que fusiona cumplimiento + mezcla de
+# scores en una sola pasada paralela sobre la matriz de requisitos
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _puntaje_kernel(req, counts, cv_mask, relevancia, out):
+        """puntaje_final por vacante: AND + conteo + mezcla 60/40, sin temporales."""
+        for i in numba.prange(req.shape[0]):
+            cumplidas = 0
+            for k in range(req.shape[1]):
+                if req[i, k] and cv_mask[k]:
+                    cumplidas += 1
+            out[i] = (cumplidas / counts[i]) * 0.6 + relevancia[i] * 0.4
+else:
+    _puntaje_kernel = None
 # Importaciones para el nuevo modelo de NLP
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity 
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import make_pipeline
 
 # --- CONFIGURACIÓN DE FLASK ---
 app = Flask(__name__)
@@ -23,10 +54,19 @@ except FileNotFoundError:
 
 # --- FUNCIONES DE NLP SIMPLIFICADO MEJORADO ---
 
+# Los términos clave se compilan una sola vez en una alternancia regex
+# (los más largos primero para que ganen sobre sus prefijos): el escaneo
+# pasa de 9 chequeos `in` en Python a una sola pasada del motor de re.
+_TERMINOS_CLAVE = ('python', 'sql', 'excel', 'javascript', 'node.js',
+                   'google ads', 'seo', 'docker', 'liderazgo')
+_TERMINOS_RE = re.compile('|'.join(
+    re.escape(t) for t in sorted(_TERMINOS_CLAVE, key=len, reverse=True)))
+
+@lru_cache(maxsize=4096)
 def normalizar_habilidad(habilidad):
     """Limpia la habilidad y maneja sinónimos básicos y versiones."""
     habilidad = habilidad.lower().strip()
-    
+
     # 1. Normalizar sinónimos clave y términos compuestos
     if 'estadistica' in habilidad:
         return 'estadística'
@@ -34,54 +74,172 @@ def normalizar_habilidad(habilidad):
         return 'trabajo en equipo'
     if 'resolución' in habilidad and 'problemas' in habilidad:
         return 'resolución de problemas'
-    
-    # 2. Manejar versiones o términos compuestos 
-    terminos_clave = ['python', 'sql', 'excel', 'javascript', 'node.js', 'google ads', 'seo', 'docker', 'liderazgo']
-    for termino in terminos_clave:
-        if termino in habilidad:
-            return termino
-            
-    return habilidad
-
-def extraer_habilidades(cv_texto, lista_habilidades_conocidas):
-    """Procesa el texto del CV y busca coincidencias con las habilidades conocidas."""
-    
-    habilidades_encontradas = set()
-    habilidades_normalizadas = [normalizar_habilidad(h) for h in lista_habilidades_conocidas]
-    cv_texto_limpio = normalizar_habilidad(cv_texto)
-    
-    for habilidad in habilidades_normalizadas:
-        if habilidad in cv_texto_limpio:
-            habilidades_encontradas.add(habilidad)
-            
-    return habilidades_encontradas
+
+    # 2. Manejar versiones o términos compuestos
+    m = _TERMINOS_RE.search(habilidad)
+    return m.group(0) if m else habilidad
+
+def extraer_habilidades(cv_texto):
+    """Procesa el texto del CV y busca coincidencias con las habilidades conocidas.
+
+    El escáner (autómata o regex) se construye una sola vez sobre el
+    vocabulario de requisitos; cada CV se recorre en una sola pasada en
+    lugar de un chequeo `in` por habilidad conocida.
+    """
+    # Solo minúsculas: pasar el CV entero por normalizar_habilidad podía
+    # colapsarlo a un único término ('python', 'trabajo en equipo', ...)
+    # en cuanto apareciera una palabra clave, vaciando el resto del match
+    cv_texto_limpio = cv_texto.lower()
+    if _SKILL_AUTOMATON is not None:
+        return {habilidad for _, habilidad in _SKILL_AUTOMATON.iter(cv_texto_limpio)}
+    if _SKILL_RE is not None:
+        return set(_SKILL_RE.findall(cv_texto_limpio))
+    return set()
 
 # --- NUEVO MODELO AVANZADO DE NLP (TF-IDF) ---
 
+# El corpus de vacantes es estático durante la vida del proceso: el
+# vectorizador se ajusta una sola vez al importar el módulo y cada request
+# se limita a transformar el CV (los términos nuevos del CV se ignoran,
+# el matching depende del vocabulario del corpus).
+VACANTE_VECTORIZER = None
+VACANTE_MATRIX_T = None
+
+def _ajustar_vectorizador():
+    """Ajusta el TF-IDF sobre las descripciones de VACANTES una sola vez."""
+    global VACANTE_VECTORIZER, VACANTE_MATRIX_T
+    if not VACANTES:
+        VACANTE_VECTORIZER = None
+        VACANTE_MATRIX_T = None
+        return
+    # N-gramas de caracteres con hashing en lugar de palabras con stopwords
+    # en inglés: no dependen de un stopword list (el corpus es español), no
+    # guardan diccionario de vocabulario y la vectorización del CV es puro
+    # hashing. norm='l2' (el default del transformador) deja las filas ya
+    # normalizadas, así que el coseno se reduce a un producto disperso; la
+    # traspuesta se precalcula en CSR para el matvec por request.
+    VACANTE_VECTORIZER = make_pipeline(
+        HashingVectorizer(analyzer='char_wb', ngram_range=(3, 5),
+                          n_features=2 ** 18, alternate_sign=False,
+                          lowercase=True),
+        TfidfTransformer(sublinear_tf=True),
+    )
+    matriz = VACANTE_VECTORIZER.fit_transform([v['descripcion'] for v in VACANTES])
+    VACANTE_MATRIX_T = matriz.T.tocsr()
+
+_ajustar_vectorizador()
+
+# --- MATRIZ DE REQUISITOS (estructura columnar para el scoring) ---
+
+# REQ_MATRIX[i, k] == True si la vacante i requiere la habilidad k del
+# vocabulario; el cumplimiento de todas las vacantes se calcula con un
+# AND + suma vectorizados en lugar de un bucle Python de sets por vacante.
+SKILL_VOCAB = []
+SKILL_IDX = {}
+REQ_MATRIX = None
+REQ_COUNTS = None
+# Requisitos normalizados por vacante, en paralelo a VACANTES (una lista
+# aparte y no una clave en el dict para no filtrar el campo en el jsonify)
+REQ_SETS = []
+
+def _construir_matriz_requisitos():
+    """Codifica los requisitos normalizados de VACANTES como matriz booleana."""
+    global SKILL_VOCAB, SKILL_IDX, REQ_MATRIX, REQ_COUNTS, REQ_SETS
+    REQ_SETS = [
+        frozenset(normalizar_habilidad(h)
+                  for h in v['requisitos_tecnicos'] + v['requisitos_blandos'])
+        for v in VACANTES
+    ]
+    SKILL_VOCAB = sorted(set().union(*REQ_SETS)) if REQ_SETS else []
+    SKILL_IDX = {s: i for i, s in enumerate(SKILL_VOCAB)}
+    REQ_MATRIX = np.zeros((len(VACANTES), len(SKILL_VOCAB)), dtype=bool)
+    for i, req in enumerate(REQ_SETS):
+        for habilidad in req:
+            REQ_MATRIX[i, SKILL_IDX[habilidad]] = True
+    # Denominador del score de cumplimiento, fijo por vacante
+    REQ_COUNTS = np.maximum(REQ_MATRIX.sum(axis=1), 1)
+
+_construir_matriz_requisitos()
+
+# Índice habilidad normalizada -> cursos: la recomendación por vacante
+# pasa de un escaneo completo de CURSOS a un acceso O(1) por faltante
+_CURSO_INDEX = {}
+for _curso in CURSOS:
+    _CURSO_INDEX.setdefault(
+        normalizar_habilidad(_curso['habilidad']), []).append(_curso)
+
+# Escáner de habilidades sobre el vocabulario de requisitos normalizados
+_SKILL_AUTOMATON = None
+_SKILL_RE = None
+
+def _construir_escaner_habilidades():
+    """Compila el vocabulario de habilidades en un escáner de una pasada."""
+    global _SKILL_AUTOMATON, _SKILL_RE
+    _SKILL_AUTOMATON = None
+    _SKILL_RE = None
+    if not SKILL_VOCAB:
+        return
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for habilidad in SKILL_VOCAB:
+            automaton.add_word(habilidad, habilidad)
+        automaton.make_automaton()
+        _SKILL_AUTOMATON = automaton
+    else:
+        # Las más largas primero para que ganen sobre sus prefijos
+        _SKILL_RE = re.compile('|'.join(
+            re.escape(h) for h in sorted(SKILL_VOCAB, key=len, reverse=True)))
+
+_construir_escaner_habilidades()
+
 def calcular_similitud_tfidf(cv_texto, vacantes):
     """Calcula la similitud coseno entre el texto del CV y la descripción de cada vacante."""
-    
-    documentos = [cv_texto] + [v['descripcion'] for v in vacantes]
-    
-    # 1. Vectoriza los documentos (TF-IDF)
-    # CORRECCIÓN: 'english' se usa como placeholder válido, ya que 'spanish' falló.
-    vectorizer = TfidfVectorizer(stop_words='english', lowercase=True) 
-    tfidf_matrix = vectorizer.fit_transform(documentos)
-    
-    # 2. Calcula la similitud coseno 
-    cosine_sim = cosine_similarity(tfidf_matrix[0], tfidf_matrix[1:])
-    
-    scores = cosine_sim[0]
-    
+
+    if VACANTE_VECTORIZER is None:
+        return {}
+
+    # 1. Vectoriza solo el CV; el corpus ya está vectorizado y en memoria
+    cv_vec = VACANTE_VECTORIZER.transform([cv_texto])
+
+    # 2. Calcula la similitud coseno: con las filas L2-normalizadas basta
+    # un producto disperso CV × corpusᵀ, sin el wrapper de sklearn
+    scores = (cv_vec @ VACANTE_MATRIX_T).toarray().ravel()
+
     # Crea un diccionario {id_vacante: score_tfidf}
     tfidf_scores = {}
     for i, score in enumerate(scores):
         vacante_id = vacantes[i]['id']
         tfidf_scores[vacante_id] = score
-        
+
     return tfidf_scores
 
 
+# Por debajo de este número de vacantes el scoring secuencial gana: el
+# despacho de joblib cuesta más de lo que se ahorra partiendo la matriz
+_UMBRAL_SCORING_PARALELO = 500
+
+def _cumplimiento_bloque(bloque, cv_mask, counts):
+    """Score de cumplimiento para un bloque de filas de la matriz."""
+    return (bloque & cv_mask).sum(axis=1) / counts
+
+def _calcular_cumplimiento(cv_mask):
+    """Calcula el score de cumplimiento de todas las vacantes.
+
+    Con corpus grandes la matriz se parte por bloques de filas y se reduce
+    en paralelo con hilos (NumPy libera el GIL en el AND + suma).
+    """
+    if len(VACANTES) <= _UMBRAL_SCORING_PARALELO:
+        return (REQ_MATRIX & cv_mask).sum(axis=1) / REQ_COUNTS
+    indices = np.array_split(np.arange(len(VACANTES)), os.cpu_count() or 4)
+    partes = Parallel(n_jobs=-1, prefer='threads')(
+        delayed(_cumplimiento_bloque)(REQ_MATRIX[idx], cv_mask, REQ_COUNTS[idx])
+        for idx in indices if len(idx))
+    return np.concatenate(partes)
+
+# Por debajo de este largo de CV y sin habilidades detectadas, la señal
+# TF-IDF es ruido cercano a cero y no justifica vectorizar el texto
+_UMBRAL_CV_CORTO = 40
+
 # --- ENDPOINTS DE LA API (ACTUALIZADO CON DOS MODELOS) ---
 
 @app.route('/aplicar', methods=['POST'])
@@ -96,40 +254,43 @@ def aplicar_vacante():
     resultados = []
     
     # MODELO 1: Extracción de Habilidades (Base para Brechas)
-    todas_habilidades = set()
-    for v in VACANTES:
-        todas_habilidades.update(v['requisitos_tecnicos'])
-        todas_habilidades.update(v['requisitos_blandos'])
+    habilidades_cv = extraer_habilidades(cv_texto)
+
+    # MODELO 2: Similitud Coseno con TF-IDF (Score de Relevancia Semántica).
+    # Se omite para CVs diminutos sin habilidades: el 60% de cumplimiento
+    # (todo ceros en ese caso) ya decide el ranking y el transform sobra
+    if habilidades_cv or len(cv_texto) >= _UMBRAL_CV_CORTO:
+        tfidf_scores = calcular_similitud_tfidf(cv_texto, VACANTES)
+    else:
+        tfidf_scores = {}
+
+    # Score FINAL de todas las vacantes (60% cumplimiento + 40% relevancia):
+    # con numba, una sola pasada paralela sobre la matriz de requisitos;
+    # si no está instalado, la reducción vectorizada de NumPy
+    cv_mask = np.zeros(len(SKILL_VOCAB), dtype=bool)
+    indices_cv = [SKILL_IDX[h] for h in habilidades_cv if h in SKILL_IDX]
+    cv_mask[indices_cv] = True
+    relevancia_vec = np.array(
+        [tfidf_scores.get(v['id'], 0.0) for v in VACANTES])
+    if _puntaje_kernel is not None and len(VACANTES):
+        puntajes = np.empty(len(VACANTES))
+        _puntaje_kernel(REQ_MATRIX, REQ_COUNTS, cv_mask, relevancia_vec, puntajes)
+    else:
+        puntajes = _calcular_cumplimiento(cv_mask) * 0.6 + relevancia_vec * 0.4
+
+    for i, vacante in enumerate(VACANTES):
+        # Requisitos ya normalizados al cargar el módulo
+        req_totales = REQ_SETS[i]
 
-    habilidades_cv = extraer_habilidades(cv_texto, todas_habilidades)
-    
-    # MODELO 2: Similitud Coseno con TF-IDF (Score de Relevancia Semántica)
-    tfidf_scores = calcular_similitud_tfidf(cv_texto, VACANTES) 
-
-    for vacante in VACANTES:
-        req_tec = set(normalizar_habilidad(h) for h in vacante['requisitos_tecnicos'])
-        req_blando = set(normalizar_habilidad(h) for h in vacante['requisitos_blandos'])
-        req_totales = req_tec.union(req_blando)
-        
         habilidades_cumplidas = habilidades_cv.intersection(req_totales)
         habilidades_faltantes = req_totales - habilidades_cv
 
-        # Cálculo del Score FINAL (Combinación de los dos modelos)
-        
-        # Score de Cumplimiento de Requisitos (Peso 60%)
-        total_req = len(req_totales)
-        score_cumplimiento = len(habilidades_cumplidas) / total_req if total_req else 0
-        
-        # Score de Relevancia Semántica (TF-IDF - Peso 40%)
-        score_relevancia = tfidf_scores.get(vacante['id'], 0)
-        
-        # Fusión de scores para robustez
-        puntaje_final = (score_cumplimiento * 0.6) + (score_relevancia * 0.4)
-        
-        # 3. Recomendación de Cursos
+        puntaje_final = float(puntajes[i])
+
+        # 3. Recomendación de Cursos (índice precalculado por habilidad)
         cursos_recomendados = [
-            curso for curso in CURSOS 
-            if normalizar_habilidad(curso['habilidad']) in habilidades_faltantes
+            curso for habilidad in habilidades_faltantes
+            for curso in _CURSO_INDEX.get(habilidad, ())
         ]
 
         resultados.append({
@@ -1,13 +1,55 @@
 import streamlit as st
 import json
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import pandas as pd # Para mostrar los resultados de manera más amigable
+from itertools import chain
+import numpy as np
+from joblib import Parallel, delayed
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.pipeline import make_pipeline
+
+# Hash rápido para claves de caché con textos largos (CVs, descripciones):
+# xxhash es opcional, igual que los demás aceleradores del proyecto; el
+# respaldo usa BLAKE2b, que mantiene un digest completo — esta clave también
+# decide el memo de resultados por sesión y una colisión serviría el
+# análisis de otro CV
+try:
+    import xxhash
+
+    def _hash_texto(texto):
+        return xxhash.xxh3_64(texto.encode('utf-8')).intdigest()
+except ImportError:
+    import hashlib
+
+    def _hash_texto(texto):
+        return hashlib.blake2b(texto.encode('utf-8'), digest_size=16).digest()
 
 # --- CARGAR MOCK DATA ---
-# Cargar datos una sola vez para que no se recarguen cada vez que Streamlit re-ejecuta el script
-@st.cache_data
+
+def _vacantes_desde_ofertas(df_ofertas):
+    """Convierte la tabla de ofertas en registros de vacantes sin iterrows().
+
+    Los splits de habilidades se hacen vectorizados y la conversión final es
+    un único to_dict('records'), en lugar de materializar una Series por fila.
+    """
+    tmp = df_ofertas.rename(columns={
+        'ID_Oferta': 'id',
+        'Puesto': 'titulo',
+        'Empresa': 'empresa',
+        'Descripcion_Puesto': 'descripcion',
+    })
+    if 'id' not in tmp.columns:
+        tmp['id'] = tmp.index.astype(str)
+    tmp['requisitos_tecnicos'] = df_ofertas['Req_Hard_Skills'].str.split(r'\s*,\s*', regex=True)
+    tmp['requisitos_blandos'] = df_ofertas['Req_Soft_Skills'].str.split(r'\s*,\s*', regex=True)
+    columnas = ['id', 'titulo', 'empresa', 'descripcion',
+                'requisitos_tecnicos', 'requisitos_blandos']
+    return tmp[columnas].to_dict('records')
+
+# Cargar datos una sola vez para que no se recarguen cada vez que Streamlit re-ejecuta el script.
+# cache_resource comparte la misma referencia en memoria: cache_data volvería a
+# des-serializar (pickle) ambas listas en cada rerun, y aquí nadie las muta.
+@st.cache_resource(show_spinner=False)
 def load_data():
     try:
         with open('vacantes.json', 'r', encoding='utf-8') as f:
@@ -15,13 +57,41 @@ def load_data():
         with open('cursos.json', 'r', encoding='utf-8') as f:
             cursos = json.load(f)
     except FileNotFoundError:
-        st.error("Archivos 'vacantes.json' o 'cursos.json' no encontrados. Asegúrate de que estén en el mismo directorio.")
-        vacantes = []
-        cursos = []
+        # Sin archivos locales, las vacantes se arman desde la tabla de ofertas
+        try:
+            from db_utils import cargar_tabla
+            vacantes = _vacantes_desde_ofertas(cargar_tabla('ofertas'))
+            cursos = []
+        except Exception:
+            st.error("Archivos 'vacantes.json' o 'cursos.json' no encontrados. Asegúrate de que estén en el mismo directorio.")
+            vacantes = []
+            cursos = []
     return vacantes, cursos
 
 VACANTES, CURSOS = load_data()
 
+@st.cache_resource(show_spinner=False)
+def _todas_habilidades():
+    """Unión de los requisitos de todas las vacantes, calculada una sola vez.
+
+    VACANTES es inmutable durante la sesión; rehacer la unión en cada clic
+    era trabajo O(vacantes x habilidades) puro desperdicio.
+    """
+    return frozenset(chain.from_iterable(
+        v['requisitos_tecnicos'] + v['requisitos_blandos'] for v in VACANTES))
+
+@st.cache_resource(show_spinner=False)
+def _cursos_por_habilidad():
+    """Indexa CURSOS por habilidad normalizada para buscar por dict lookup.
+
+    Sin el índice, cada vacante del bucle de resultados escaneaba la lista
+    completa de cursos; con él, cada faltante cuesta un acceso O(1).
+    """
+    indice = {}
+    for curso in CURSOS:
+        indice.setdefault(normalizar_habilidad(curso['habilidad']), []).append(curso)
+    return indice
+
 # --- FUNCIONES DE NLP SIMPLIFICADO MEJORADO ---
 
 def normalizar_habilidad(habilidad):
@@ -44,35 +114,90 @@ def normalizar_habilidad(habilidad):
             
     return habilidad
 
+@st.cache_resource(show_spinner=False, hash_funcs={str: _hash_texto})
+def _escaner_habilidades(lista_habilidades):
+    """Compila las habilidades conocidas en una sola alternancia regex.
+
+    Las más largas primero para que ganen sobre sus prefijos; el CV se
+    escanea en una pasada del motor de re en vez de un `in` por habilidad.
+    """
+    normalizadas = {normalizar_habilidad(h) for h in lista_habilidades}
+    if not normalizadas:
+        return None
+    patron = '|'.join(re.escape(h) for h in sorted(normalizadas, key=len, reverse=True))
+    return re.compile(patron)
+
 def extraer_habilidades(cv_texto, lista_habilidades_conocidas):
     """Procesa el texto del CV y busca coincidencias con las habilidades conocidas."""
-    
-    habilidades_encontradas = set()
-    habilidades_normalizadas = [normalizar_habilidad(h) for h in lista_habilidades_conocidas]
-    cv_texto_limpio = normalizar_habilidad(cv_texto)
-    
-    for habilidad in habilidades_normalizadas:
-        if habilidad in cv_texto_limpio:
-            habilidades_encontradas.add(habilidad)
-            
-    return habilidades_encontradas
+    escaner = _escaner_habilidades(frozenset(lista_habilidades_conocidas))
+    if escaner is None:
+        return set()
+    # Solo minúsculas: pasar el CV entero por normalizar_habilidad lo
+    # colapsaba a un único término canónico en cuanto aparecía una palabra
+    # clave, y el escáner dejaba de ver el resto del texto
+    cv_texto_limpio = cv_texto.lower()
+    return set(escaner.findall(cv_texto_limpio))
 
 # --- NUEVO MODELO AVANZADO DE NLP (TF-IDF) ---
 
+# Por debajo de este tamaño de corpus el fit secuencial gana: el costo de
+# arrancar workers de joblib supera lo que se ahorra tokenizando en paralelo
+_UMBRAL_FIT_PARALELO = 2000
+
+def _vocabulario_bloque(docs):
+    """Tokeniza un bloque del corpus y devuelve su vocabulario."""
+    cv = CountVectorizer(stop_words='english', lowercase=True)
+    cv.fit(docs)
+    return set(cv.vocabulary_)
+
+def _fit_tfidf_paralelo(descripciones, n_jobs=4):
+    """Ajusta TF-IDF tokenizando el corpus por bloques en paralelo.
+
+    Descubre el vocabulario por bloques con joblib, lo unifica, cuenta en
+    paralelo con ese vocabulario fijo y apila los bloques CSR.
+    """
+    bloques = [list(b) for b in np.array_split(
+        np.asarray(descripciones, dtype=object), n_jobs) if len(b)]
+    vocabularios = Parallel(n_jobs=n_jobs)(
+        delayed(_vocabulario_bloque)(b) for b in bloques)
+    vocabulario = sorted(set().union(*vocabularios))
+    cv = CountVectorizer(stop_words='english', lowercase=True, vocabulary=vocabulario)
+    conteos = sparse.vstack(Parallel(n_jobs=n_jobs)(
+        delayed(cv.transform)(b) for b in bloques))
+    transformador = TfidfTransformer(sublinear_tf=True, norm='l2').fit(conteos)
+    return make_pipeline(cv, transformador), transformador.transform(conteos)
+
+@st.cache_resource(show_spinner=False, hash_funcs={str: _hash_texto})
+def _vectorizador_vacantes(descripciones):
+    """Ajusta el vectorizador TF-IDF una sola vez sobre el corpus de vacantes.
+
+    El corpus es inmutable durante la sesión; re-tokenizarlo en cada clic era
+    el costo dominante del análisis.
+    """
+    if len(descripciones) > _UMBRAL_FIT_PARALELO:
+        return _fit_tfidf_paralelo(list(descripciones))
+    # CORRECCIÓN: 'english' se usa como placeholder válido, ya que 'spanish' falló.
+    vectorizer = TfidfVectorizer(stop_words='english', lowercase=True,
+                                 sublinear_tf=True, norm='l2')
+    matriz = vectorizer.fit_transform(descripciones)
+    return vectorizer, matriz
+
 def calcular_similitud_tfidf(cv_texto, vacantes):
     """Calcula la similitud coseno entre el texto del CV y la descripción de cada vacante."""
-    
-    documentos = [cv_texto] + [v['descripcion'] for v in vacantes]
-    
-    # 1. Vectoriza los documentos (TF-IDF)
-    # CORRECCIÓN: 'english' se usa como placeholder válido, ya que 'spanish' falló.
-    vectorizer = TfidfVectorizer(stop_words='english', lowercase=True) 
-    tfidf_matrix = vectorizer.fit_transform(documentos)
-    
-    # 2. Calcula la similitud coseno 
-    cosine_sim = cosine_similarity(tfidf_matrix[0], tfidf_matrix[1:])
-    
-    scores = cosine_sim[0]
+
+    # Sin vacantes (JSON ausente y DB inaccesible) no hay corpus que
+    # ajustar: fit_transform sobre una tupla vacía levanta ValueError
+    if not vacantes:
+        return {}
+
+    # 1. Vectoriza solo el CV; el corpus ya está ajustado y cacheado
+    vectorizer, tfidf_matrix = _vectorizador_vacantes(
+        tuple(v['descripcion'] for v in vacantes))
+    cv_vec = vectorizer.transform([cv_texto])
+
+    # 2. Calcula la similitud coseno: con norm='l2' las filas ya están
+    # normalizadas, así que basta un producto disperso CV × matriz
+    scores = (cv_vec @ tfidf_matrix.T).toarray().ravel()
     
     # Crea un diccionario {id_vacante: score_tfidf}
     tfidf_scores = {}
@@ -84,66 +209,99 @@ def calcular_similitud_tfidf(cv_texto, vacantes):
 
 # --- FUNCIÓN PRINCIPAL DE MATCHING ---
 
+@st.cache_resource(show_spinner=False)
+def _estructuras_matching(vacantes):
+    """Codifica los requisitos como una matriz dispersa vacante × habilidad.
+
+    Se construye una sola vez por corpus: el scoring por clic queda en dos
+    operaciones dispersas en C en lugar de un bucle Python por vacante.
+    """
+    reqs = [
+        frozenset(normalizar_habilidad(h)
+                  for h in v['requisitos_tecnicos'] + v['requisitos_blandos'])
+        for v in vacantes
+    ]
+    vocabulario = sorted(set().union(*reqs)) if reqs else []
+    skill_idx = {s: i for i, s in enumerate(vocabulario)}
+    filas, columnas = [], []
+    for i, req in enumerate(reqs):
+        for habilidad in req:
+            filas.append(i)
+            columnas.append(skill_idx[habilidad])
+    R = sparse.csr_matrix(
+        (np.ones(len(filas)), (filas, columnas)),
+        shape=(len(vacantes), max(len(skill_idx), 1)))
+    totales = np.fromiter((len(r) for r in reqs), dtype=np.float64,
+                          count=len(reqs))
+    return skill_idx, R, reqs, totales
+
+# Solo los mejores matches se decodifican a listas de habilidades y cursos;
+# para el resto de las vacantes esas estructuras nunca se materializan
+_TOP_K_RESULTADOS = 10
+
 def perform_matching(cv_texto):
     if not cv_texto:
         return []
 
-    resultados = []
-    
     # MODELO 1: Extracción de Habilidades (Base para Brechas)
-    todas_habilidades = set()
-    for v in VACANTES:
-        todas_habilidades.update(v['requisitos_tecnicos'])
-        todas_habilidades.update(v['requisitos_blandos'])
+    habilidades_cv = extraer_habilidades(cv_texto, _todas_habilidades())
 
-    habilidades_cv = extraer_habilidades(cv_texto, todas_habilidades)
-    
     # MODELO 2: Similitud Coseno con TF-IDF (Score de Relevancia Semántica)
-    tfidf_scores = calcular_similitud_tfidf(cv_texto, VACANTES) 
+    tfidf_scores = calcular_similitud_tfidf(cv_texto, VACANTES)
 
-    for vacante in VACANTES:
-        req_tec = set(normalizar_habilidad(h) for h in vacante['requisitos_tecnicos'])
-        req_blando = set(normalizar_habilidad(h) for h in vacante['requisitos_blandos'])
-        req_totales = req_tec.union(req_blando)
-        
+    # Cálculo del Score FINAL: todos los cumplimientos de una vez con una
+    # multiplicación dispersa (60% requisitos + 40% relevancia TF-IDF)
+    skill_idx, R, reqs, totales = _estructuras_matching(VACANTES)
+    cv_vec = np.zeros(R.shape[1])
+    cv_vec[[skill_idx[h] for h in habilidades_cv if h in skill_idx]] = 1.0
+    cumplidas_count = R @ cv_vec
+    score_cumplimiento = cumplidas_count / np.maximum(totales, 1)
+    score_relevancia = np.array([tfidf_scores.get(v['id'], 0) for v in VACANTES])
+    puntajes = (score_cumplimiento * 0.6) + (score_relevancia * 0.4)
+
+    # Solo se itera en Python para dar formato, ya en orden de mejor match
+    # y únicamente sobre el top-K que la interfaz va a mostrar
+    cursos_idx = _cursos_por_habilidad()
+    resultados = []
+    for i in np.argsort(-puntajes)[:_TOP_K_RESULTADOS]:
+        vacante = VACANTES[i]
+        req_totales = reqs[i]
         habilidades_cumplidas = habilidades_cv.intersection(req_totales)
         habilidades_faltantes = req_totales - habilidades_cv
 
-        # Cálculo del Score FINAL (Combinación de los dos modelos)
-        
-        # Score de Cumplimiento de Requisitos (Peso 60%)
-        total_req = len(req_totales)
-        score_cumplimiento = len(habilidades_cumplidas) / total_req if total_req else 0
-        
-        # Score de Relevancia Semántica (TF-IDF - Peso 40%)
-        score_relevancia = tfidf_scores.get(vacante['id'], 0)
-        
-        # Fusión de scores para robustez
-        puntaje_final = (score_cumplimiento * 0.6) + (score_relevancia * 0.4)
-        
         # 3. Recomendación de Cursos
         cursos_recomendados_para_vacante = [
-            curso for curso in CURSOS 
-            if normalizar_habilidad(curso['habilidad']) in habilidades_faltantes
+            curso for habilidad in habilidades_faltantes
+            for curso in cursos_idx.get(habilidad, ())
         ]
 
         resultados.append({
             "vacante": vacante,
-            "puntaje_match": round(puntaje_final * 100, 2), # Ahora es más robusto
+            "puntaje_match": round(float(puntajes[i]) * 100, 2), # Ahora es más robusto
             "habilidades_cumplidas": list(habilidades_cumplidas),
             "habilidades_faltantes": list(habilidades_faltantes),
             "cursos_recomendados": cursos_recomendados_para_vacante
         })
 
-    # 4. Ordenar resultados por mejor match
-    resultados_ordenados = sorted(resultados, key=lambda x: x['puntaje_match'], reverse=True)
-    
-    return resultados_ordenados
+    return resultados
 
 # --- INTERFAZ DE STREAMLIT ---
 
+@st.cache_data(show_spinner=False)
+def _css_global():
+    """Lee estilos.css una sola vez; cada rerun reutiliza la misma cadena."""
+    try:
+        with open('estilos.css', 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return ''
+
 st.set_page_config(page_title="CV Matcher y Recomendador de Cursos", layout="wide")
 
+_css = _css_global()
+if _css:
+    st.markdown(f"<style>{_css}</style>", unsafe_allow_html=True)
+
 st.title("Buscador de Vacantes y Recomendador de Cursos")
 st.markdown("Copia y pega el texto de tu CV para encontrar las vacantes más adecuadas y cursos que te ayudarán a cerrar brechas de habilidades.")
 
@@ -151,36 +309,47 @@ cv_texto_input = st.text_area("Pega aquí el texto completo de tu CV:", height=3
 
 if st.button("Buscar Vacantes"):
     if cv_texto_input:
-        with st.spinner("Analizando CV y buscando vacantes..."):
-            resultados = perform_matching(cv_texto_input)
-        
+        # Memo por sesión: si el texto del CV no cambió desde el último clic,
+        # se reutilizan los resultados sin repetir TF-IDF ni el matching
+        clave_cv = _hash_texto(cv_texto_input)
+        if st.session_state.get('clave_cv_previa') == clave_cv:
+            resultados = st.session_state['resultados_previos']
+        else:
+            with st.spinner("Analizando CV y buscando vacantes..."):
+                resultados = perform_matching(cv_texto_input)
+            st.session_state['clave_cv_previa'] = clave_cv
+            st.session_state['resultados_previos'] = resultados
+
         if resultados:
-            st.subheader("Resultados de Match:")
+            # Todo el listado se arma como un solo markdown: una llamada a
+            # st.markdown es un solo mensaje al navegador, en vez de ~6 por vacante
+            partes = ["## Resultados de Match:"]
             for i, res in enumerate(resultados):
-                st.markdown(f"---")
-                st.markdown(f"### {i+1}. Vacante: {res['vacante']['titulo']} (Match: {res['puntaje_match']}%)")
-                st.write(f"**Empresa:** {res['vacante']['empresa']}")
-                st.write(f"**Descripción:** {res['vacante']['descripcion']}")
-                
-                st.markdown(f"**Habilidades en tu CV que coinciden:**")
+                partes.append("---")
+                partes.append(f"### {i+1}. Vacante: {res['vacante']['titulo']} (Match: {res['puntaje_match']}%)")
+                partes.append(f"**Empresa:** {res['vacante']['empresa']}")
+                partes.append(f"**Descripción:** {res['vacante']['descripcion']}")
+
+                partes.append("**Habilidades en tu CV que coinciden:**")
                 if res['habilidades_cumplidas']:
-                    st.success(", ".join(res['habilidades_cumplidas']))
+                    partes.append(f"✅ {', '.join(res['habilidades_cumplidas'])}")
                 else:
-                    st.info("No se encontraron habilidades que coincidan directamente.")
-                
-                st.markdown(f"**Habilidades requeridas que te faltan:**")
+                    partes.append("ℹ️ No se encontraron habilidades que coincidan directamente.")
+
+                partes.append("**Habilidades requeridas que te faltan:**")
                 if res['habilidades_faltantes']:
-                    st.warning(", ".join(res['habilidades_faltantes']))
+                    partes.append(f"⚠️ {', '.join(res['habilidades_faltantes'])}")
                 else:
-                    st.success("¡Parece que tienes todas las habilidades requeridas!")
-                
-                st.markdown(f"**Cursos recomendados para cerrar brechas:**")
+                    partes.append("✅ ¡Parece que tienes todas las habilidades requeridas!")
+
+                partes.append("**Cursos recomendados para cerrar brechas:**")
                 if res['cursos_recomendados']:
-                    cursos_df = pd.DataFrame(res['cursos_recomendados'])
-                    cursos_df.columns = ['ID', 'Título del Curso', 'Habilidad'] # Renombrar columnas para mejor visualización
-                    st.dataframe(cursos_df[['Título del Curso', 'Habilidad']], hide_index=True)
+                    partes.extend(
+                        f"- {curso['titulo_curso']} ({curso['habilidad']})"
+                        for curso in res['cursos_recomendados'])
                 else:
-                    st.info("No se encontraron cursos recomendados (¡ya tienes todas las habilidades!).")
+                    partes.append("ℹ️ No se encontraron cursos recomendados (¡ya tienes todas las habilidades!).")
+            st.markdown("\n\n".join(partes))
         else:
             st.info("No se encontraron vacantes o no hay datos para procesar.")
     else: